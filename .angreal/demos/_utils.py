@@ -2,6 +2,9 @@
 Shared utilities for demo commands.
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import angreal  # type: ignore
 
@@ -9,6 +12,20 @@ import angreal  # type: ignore
 PROJECT_ROOT = Path(angreal.get_root()).parent
 
 
+def _scan(path):
+    """Return the `os.DirEntry`s of `path`, or [] if it doesn't exist.
+
+    scandir reuses the dirent type from the directory read, so the
+    `is_dir()`/`is_file()` checks below cost no extra stat per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=None)
 def get_rust_tutorial_directories():
     """Get all Rust tutorial directories from examples/tutorials/.
 
@@ -18,23 +35,21 @@ def get_rust_tutorial_directories():
       tutorials/computation-graphs/library/01-computation-graph/
       tutorials/computation-graphs/service/...
 
-    Returns (dir_name, relative_path) tuples.
+    Returns (dir_name, relative_path) tuples. Discovery runs once per process
+    (several command registrars share it), hence the cached, immutable result.
     """
     tutorials_dir = PROJECT_ROOT / "examples" / "tutorials"
-    if not tutorials_dir.exists():
-        return []
     results = []
     for capability in ["workflows", "computation-graphs"]:
         for mode in ["library", "service"]:
-            scan_dir = tutorials_dir / capability / mode
-            if scan_dir.exists():
-                for d in scan_dir.iterdir():
-                    if d.is_dir():
-                        rel_path = f"examples/tutorials/{capability}/{mode}/{d.name}"
-                        results.append((d.name, rel_path))
-    return results
+            for d in _scan(tutorials_dir / capability / mode):
+                if d.is_dir(follow_symlinks=False):
+                    rel_path = f"examples/tutorials/{capability}/{mode}/{d.name}"
+                    results.append((d.name, rel_path))
+    return tuple(results)
 
 
+@lru_cache(maxsize=None)
 def get_rust_feature_directories():
     """Get all Rust feature example directories from examples/features/.
 
@@ -43,8 +58,6 @@ def get_rust_feature_directories():
       features/computation-graphs/packaged-graph/
     """
     features_dir = PROJECT_ROOT / "examples" / "features"
-    if not features_dir.exists():
-        return []
     # An example dir is EITHER embedded (has src + Cargo, run via `cargo run` —
     # returned here) OR packaged (has a `package.toml`, run through the server
     # gold path — discovered separately by `get_packaged_example_directories`).
@@ -55,18 +68,21 @@ def get_rust_feature_directories():
     excluded = {"validation-failures", "python-workflow"}
     results = []
     for capability in ["workflows", "computation-graphs"]:
-        scan_dir = features_dir / capability
-        if scan_dir.exists():
-            for d in scan_dir.iterdir():
-                if not d.is_dir() or d.name in excluded:
-                    continue
-                if (d / "package.toml").exists():
-                    continue  # packaged → the gold-path registrar owns it
-                rel_path = f"examples/features/{capability}/{d.name}"
-                results.append((d.name, rel_path))
-    return results
+        for d in _scan(features_dir / capability):
+            if not d.is_dir(follow_symlinks=False) or d.name in excluded:
+                continue
+            if os.path.exists(os.path.join(d.path, "package.toml")):
+                continue  # packaged → the gold-path registrar owns it
+            rel_path = f"examples/features/{capability}/{d.name}"
+            results.append((d.name, rel_path))
+    return tuple(results)
+
+
+# `workflow_name = "..."` / `graph_name = "..."` lines in a package.toml.
+_MANIFEST_NAME_RE = re.compile(r'^[ \t]*(workflow_name|graph_name)\w*[ \t]*=(.*)$', re.MULTILINE)
 
 
+@lru_cache(maxsize=None)
 def get_packaged_example_directories():
     """Every packaged example (a dir with a `package.toml`) under
     examples/features/, with its parsed manifest metadata. These run through
@@ -77,35 +93,29 @@ def get_packaged_example_directories():
     `graph_name` (whichever the package declares).
     """
     features_dir = PROJECT_ROOT / "examples" / "features"
-    if not features_dir.exists():
-        return []
     results = []
     for capability in ["workflows", "computation-graphs"]:
-        scan_dir = features_dir / capability
-        if not scan_dir.exists():
-            continue
-        for d in sorted(scan_dir.iterdir()):
-            pt = d / "package.toml"
-            if not d.is_dir() or not pt.exists():
+        for d in sorted(_scan(features_dir / capability), key=lambda e: e.name):
+            pt = Path(d.path) / "package.toml"
+            if not d.is_dir(follow_symlinks=False) or not pt.exists():
                 continue
-            meta = {}
-            for line in pt.read_text().splitlines():
-                line = line.strip()
-                for key in ("workflow_name", "graph_name"):
-                    if line.startswith(key) and "=" in line:
-                        meta[key] = line.split("=", 1)[1].strip().strip('"')
+            # One regex scan over the manifest; a later line wins, as before.
+            meta = {
+                m.group(1): m.group(2).strip().strip('"')
+                for m in _MANIFEST_NAME_RE.finditer(pt.read_text())
+            }
             results.append((d.name, f"{capability}/{d.name}", meta))
-    return results
+    return tuple(results)
 
 
+@lru_cache(maxsize=None)
 def get_rust_performance_directories():
     """Get all Rust performance example directories from examples/performance/."""
     perf_dir = PROJECT_ROOT / "examples" / "performance"
-    if not perf_dir.exists():
-        return []
-    return [d.name for d in perf_dir.iterdir() if d.is_dir()]
+    return tuple(d.name for d in _scan(perf_dir) if d.is_dir(follow_symlinks=False))
 
 
+@lru_cache(maxsize=None)
 def get_python_tutorial_files():
     """Get all Python tutorial files from examples/tutorials/python/.
 
@@ -116,13 +126,11 @@ def get_python_tutorial_files():
     results = []
     python_dir = PROJECT_ROOT / "examples" / "tutorials" / "python"
     for capability in ["workflows", "computation-graphs"]:
-        scan_dir = python_dir / capability
-        if scan_dir.exists():
-            for f in scan_dir.iterdir():
-                if f.is_file() and f.suffix == ".py" and not f.name.startswith("_"):
-                    rel_path = f"examples/tutorials/python/{capability}/{f.name}"
-                    results.append((f.name, rel_path))
-    return results
+        for f in _scan(python_dir / capability):
+            if f.name.endswith(".py") and not f.name.startswith("_") and f.is_file():
+                rel_path = f"examples/tutorials/python/{capability}/{f.name}"
+                results.append((f.name, rel_path))
+    return tuple(results)
 
 
 def normalize_command_name(name):
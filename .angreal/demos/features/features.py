@@ -98,12 +98,11 @@ def python_workflow():
         return 1
 
     venv_name = "python-workflow-demo"
-    venv_path = project_root / venv_name
 
     try:
-        _venv, python_exe, _pip_exe = _build_and_install_cloaca_unified(venv_name)
+        python_exe = _build_and_install_cloaca_unified(venv_name).python
         result = subprocess.run(
-            [str(python_exe), str(runner_script)],
+            [python_exe, str(runner_script)],
             cwd=str(example_dir),
             capture_output=True,
             text=True,
@@ -128,9 +127,6 @@ def python_workflow():
     except Exception as e:
         print(f"ERROR: setup failed: {e}")
         return 1
-    finally:
-        if venv_path.exists():
-            shutil.rmtree(venv_path)
 
 
 # --- gold-path packaged demos (CLOACI-I-0138) --------------------------------
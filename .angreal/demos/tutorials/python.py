@@ -1,14 +1,14 @@
 """demos tutorials python — run individual Python tutorial examples."""
 
 import os
-import shutil
 import subprocess
 import sys
-import time
+import threading
 
 import angreal  # type: ignore
 
 from test._python_utils import _build_and_install_cloaca_unified
+from test._utils import wait_for_postgres_stable
 from utils import (
     docker_up,
     docker_down,
@@ -38,22 +38,37 @@ def _run_python_tutorial(tutorial_num, tutorial_rel_path, backend="sqlite"):
         print(f"ERROR: Tutorial file not found: {tutorial_path}", flush=True)
         return 1
 
-    venv_name = f"tutorial-{tutorial_num}-unified"
+    # One persistent venv shared by every tutorial — only the cloaca wheel
+    # is swapped between runs (see _ensure_persistent_venv).
+    venv_name = "tutorial-env-unified"
     venv_path = project_root / venv_name
 
+    # The container start runs in the background while the venv and wheel
+    # are prepared; readiness is only awaited once the tutorial needs it.
+    docker_thread = None
+    docker_exit = []
     try:
         if backend == "postgres":
-            print("Starting PostgreSQL container...", flush=True)
-            if docker_up() != 0:
+            print("Starting PostgreSQL container (background)...", flush=True)
+            docker_thread = threading.Thread(
+                target=lambda: docker_exit.append(docker_up()),
+                name="docker-bringup",
+                daemon=True,
+            )
+            docker_thread.start()
+
+        print("Building cloaca wheel and tutorial venv...", flush=True)
+        python_exe = _build_and_install_cloaca_unified(venv_name).python
+
+        if docker_thread is not None:
+            docker_thread.join()
+            if docker_exit != [0]:
                 raise Exception("Failed to start PostgreSQL container")
             print("Waiting for PostgreSQL to be ready...", flush=True)
-            time.sleep(10)
+            wait_for_postgres_stable(cwd=str(project_root))
             if not check_postgres_container_health():
                 raise Exception("PostgreSQL container is not healthy")
 
-        print("Building cloaca wheel and tutorial venv...", flush=True)
-        _venv, python_exe, _pip_exe = _build_and_install_cloaca_unified(venv_name)
-
         print(f"[diagnostic] post-venv: tutorial_num={tutorial_num} backend={backend} "
               f"venv={venv_path} python={python_exe}", flush=True)
 
@@ -78,7 +93,7 @@ def _run_python_tutorial(tutorial_num, tutorial_rel_path, backend="sqlite"):
         # `python -u` forces unbuffered stdio in the child so CI sees
         # progress + tracebacks even if the tutorial crashes mid-stream.
         result = subprocess.run(
-            [str(python_exe), "-u", str(tutorial_path)],
+            [python_exe, "-u", str(tutorial_path)],
             cwd=str(python_tutorials_dir),
             capture_output=True,
             text=True,
@@ -118,10 +133,10 @@ def _run_python_tutorial(tutorial_num, tutorial_rel_path, backend="sqlite"):
         sys.stderr.flush()
         return 1
     finally:
+        if docker_thread is not None:
+            docker_thread.join()
         if backend == "postgres":
             docker_down(remove_volumes=True)
-        if venv_path.exists():
-            shutil.rmtree(venv_path)
 
 
 def _register(tutorial_file, tutorial_rel_path):
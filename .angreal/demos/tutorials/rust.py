@@ -1,8 +1,11 @@
 """demos tutorials rust — run individual Rust tutorial examples."""
 
+import concurrent.futures
+import os
+
 import angreal  # type: ignore
 
-from utils import run_example_or_tutorial
+from utils import build_example, example_needs_postgres, run_example_or_tutorial
 
 from .._utils import (
     PROJECT_ROOT,
@@ -44,3 +47,91 @@ _commands = {
     name: _register(name, path)
     for name, path in get_rust_tutorial_directories()
 }
+
+
+@demos()
+@tutorials()
+@rust()
+@angreal.command(
+    name="all",
+    about="run every Rust tutorial, several at a time",
+    when_to_use=["validating all tutorials after a core change", "pre-release example sweep"],
+    when_not_to_use=["iterating on a single tutorial (run it by number)"],
+)
+@angreal.argument(
+    name="jobs",
+    long="jobs",
+    short="j",
+    help="tutorials run concurrently (default: cpu_count - 2)",
+    takes_value=True,
+)
+@angreal.argument(
+    name="fail_fast",
+    long="fail-fast",
+    help="stop scheduling tutorials after the first failure",
+    takes_value=False,
+    is_flag=True,
+)
+def rust_tutorial_all(jobs=None, fail_fast=False):
+    """Run all Rust tutorials and report failures at the end.
+
+    All tutorials build into one shared cargo target dir (see _example_env in
+    utils), so the common dependency graph compiles once — but cargo also
+    serializes builds on that dir's lock. They are therefore compiled first,
+    one after another, and only the runs overlap: SQLite tutorials share no
+    state and run concurrently, each one's output printed as a block when it
+    finishes. Tutorials that need the dev-stack Postgres run afterwards, one
+    at a time, since they share that database.
+    """
+    worker_count = max(1, int(jobs) if jobs else (os.cpu_count() or 1) - 2)
+    tutorials_to_run = sorted(get_rust_tutorial_directories())
+    sqlite_group = [t for t in tutorials_to_run if not example_needs_postgres(t[1])]
+    pg_group = [t for t in tutorials_to_run if example_needs_postgres(t[1])]
+    print(
+        f"Running {len(tutorials_to_run)} Rust tutorials "
+        f"({len(sqlite_group)} SQLite, {worker_count} in parallel; {len(pg_group)} Postgres, serial)"
+    )
+
+    failed = []
+    built = set()
+    for dir_name, rel_path in tutorials_to_run:
+        if build_example(PROJECT_ROOT, rel_path) == 0:
+            built.add(dir_name)
+        else:
+            print(f"FAILED: {dir_name} (build)")
+            failed.append(dir_name)
+            if fail_fast:
+                break
+    if failed and fail_fast:
+        built.clear()
+    sqlite_group = [t for t in sqlite_group if t[0] in built]
+    pg_group = [t for t in pg_group if t[0] in built]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as pool:
+        futures = {
+            pool.submit(run_example_or_tutorial, PROJECT_ROOT, rel_path, dir_name, capture=True): dir_name
+            for dir_name, rel_path in sqlite_group
+        }
+        for future in concurrent.futures.as_completed(futures):
+            dir_name = futures[future]
+            rc = future.result()
+            print(f"{'SUCCESS' if rc == 0 else 'FAILED'}: {dir_name}")
+            if rc != 0:
+                failed.append(dir_name)
+                if fail_fast:
+                    for f in futures:
+                        f.cancel()
+                    break
+
+    for dir_name, rel_path in pg_group:
+        if failed and fail_fast:
+            break
+        rc = run_example_or_tutorial(PROJECT_ROOT, rel_path, dir_name)
+        print(f"{'SUCCESS' if rc == 0 else 'FAILED'}: {dir_name}")
+        if rc != 0:
+            failed.append(dir_name)
+
+    if failed:
+        failure_summary = "\n".join(f"- {name}" for name in sorted(failed))
+        raise RuntimeError(f"Some Rust tutorials failed:\n{failure_summary}")
+    print("SUCCESS: All Rust tutorials passed")
@@ -15,6 +15,7 @@ Run `angreal purge --dry-run` first to preview.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -32,15 +33,27 @@ HOME = Path.home()
 
 
 def _dir_size(path: Path) -> int:
-    """Return total size of a directory in bytes. 0 if missing."""
-    if not path.exists():
-        return 0
+    """Return total size of a directory in bytes. 0 if missing.
+
+    Walks with `os.scandir` on plain strings rather than `rglob`: a `target/`
+    holds tens of thousands of files, and per-entry `Path` objects plus
+    separate `is_file`/`is_symlink`/`stat` calls dominate the runtime. Each
+    DirEntry already carries its type and caches its lstat result.
+    """
     total = 0
-    for p in path.rglob("*"):
+    stack = [os.fspath(path)]
+    while stack:
         try:
-            if p.is_file() and not p.is_symlink():
-                total += p.stat().st_size
-        except (FileNotFoundError, PermissionError):
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except (FileNotFoundError, PermissionError):
+                        continue
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             continue
     return total
 
@@ -59,36 +72,43 @@ def _fmt(size: int) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _workspace_targets() -> List[Path]:
-    """Return every `target/` directory under PROJECT_ROOT, ignoring
-    anything inside the cargo home (which we treat separately)."""
-    cargo_home = (HOME / ".cargo").resolve()
-    out: List[Path] = []
-    for target in PROJECT_ROOT.rglob("target"):
-        if not target.is_dir():
-            continue
-        try:
-            if cargo_home in target.resolve().parents:
-                continue
-        except (FileNotFoundError, PermissionError):
-            continue
-        out.append(target)
-    # Sort biggest first so the report leads with the wins.
-    out.sort(key=_dir_size, reverse=True)
-    return out
+# Python cache directories removed wholesale (plus any `*.egg-info`).
+_PYTHON_ARTIFACT_DIRS = {"__pycache__", ".pytest_cache", ".ruff_cache"}
+
+
+def _scan_workspace() -> Tuple[List[Path], List[Path]]:
+    """Return (`target/` dirs, Python cache dirs) under PROJECT_ROOT.
+
+    One top-down `os.walk` classifies each directory by name. Matches are
+    recorded and pruned rather than entered, so the walk never touches the
+    tens of thousands of files inside a `target/`. Separate `rglob` passes
+    per pattern did that five times. Anything inside the cargo home is
+    ignored; we handle that separately.
+    """
+    cargo_home = os.path.realpath(HOME / ".cargo") + os.sep
+    targets: List[Path] = []
+    artifacts: List[Path] = []
+    for dirpath, dirnames, _filenames in os.walk(PROJECT_ROOT, topdown=True):
+        keep = []
+        for name in dirnames:
+            full = os.path.join(dirpath, name)
+            if name == "target":
+                if not os.path.realpath(full).startswith(cargo_home):
+                    targets.append(Path(full))
+            elif name in _PYTHON_ARTIFACT_DIRS or name.endswith(".egg-info"):
+                artifacts.append(Path(full))
+            elif name != ".git":
+                keep.append(name)
+        dirnames[:] = keep
+    return targets, artifacts
 
 
 def _python_venvs() -> List[Path]:
-    """The `test-env-*` venvs angreal builds for python scenarios."""
-    return sorted(PROJECT_ROOT.glob("test-env-*"))
-
-
-def _python_artifacts() -> List[Path]:
-    """`__pycache__`, `.pytest_cache`, `*.egg-info` strewn across the tree."""
+    """The persistent venvs angreal builds for python scenarios and demos."""
     out: List[Path] = []
-    for pattern in ("__pycache__", ".pytest_cache", ".ruff_cache", "*.egg-info"):
-        out.extend(p for p in PROJECT_ROOT.rglob(pattern) if p.is_dir())
-    return out
+    for pattern in ("test-env-*", "tutorial-env-*", "python-workflow-demo"):
+        out.extend(p for p in PROJECT_ROOT.glob(pattern) if p.is_dir())
+    return sorted(out)
 
 
 def _cargo_cache_dirs() -> List[Path]:
@@ -239,9 +259,8 @@ def purge(dry_run: bool = False, cargo_cache: bool = False, keep_docker: bool =
         print("    preserving docker services")
 
     # Inventory each bucket, then act.
-    targets = _workspace_targets()
+    targets, pyart = _scan_workspace()
     venvs = _python_venvs()
-    pyart = _python_artifacts()
 
     targets_total, _ = _report("Workspace `target/` directories", targets)
     venvs_total, _ = _report("Python test venvs", venvs)
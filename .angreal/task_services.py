@@ -3,10 +3,12 @@ Service management tasks for Cloacina.
 """
 
 import angreal  # type: ignore
-import shutil
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from utils import docker_up, docker_down, docker_clean
+from utils import docker_up, docker_down, docker_clean, fast_rmtree
 from test._python_utils import scrub_python_artifacts
 
 # Define command group
@@ -20,9 +22,20 @@ services = angreal.command_group(name="services", about="commands for managing b
     when_to_use=["starting development", "running tests", "local database access"],
     when_not_to_use=["production environments", "CI runners", "when services already running"]
 )
-def up():
-    """Start backing services for local development."""
-    return docker_up()
+@angreal.argument(
+    name="pull",
+    long="pull",
+    help="re-pull service images even if present locally",
+    takes_value=False,
+    is_flag=True
+)
+def up(pull=False):
+    """Start backing services for local development.
+
+    Returns once every service reports healthy, so the stack is usable as
+    soon as the command exits.
+    """
+    return docker_up(pull="always" if pull else "missing", wait=True)
 
 
 @services()
@@ -70,7 +83,7 @@ def reset(clean=False):
     if exit_code != 0:
         return exit_code
 
-    return docker_up()
+    return docker_up(wait=True)
 
 
 @services()
@@ -93,20 +106,30 @@ def clean():
     if exit_code != 0:
         return exit_code
 
-    # Remove root target directory
+    # Remove root target directory. `cargo clean` knows the layout it wrote
+    # and removes it natively; `rm -rf` is only the fallback when cargo is
+    # missing or refuses (e.g. a corrupted workspace manifest).
     project_root = Path(angreal.get_root()).parent
     root_target = project_root / "target"
     if root_target.exists():
-        shutil.rmtree(root_target)
-
-    # Remove target directories in examples
+        try:
+            cleaned = subprocess.run(["cargo", "clean"], cwd=str(project_root)).returncode == 0
+        except FileNotFoundError:
+            cleaned = False
+        if not cleaned and root_target.exists():
+            fast_rmtree(root_target)
+
+    # Remove target directories in examples. The removals are independent
+    # and unlink-bound, so run them side by side.
     examples_dir = project_root / "examples"
     if examples_dir.exists():
-        for example_dir in examples_dir.iterdir():
-            if example_dir.is_dir():
-                target_dir = example_dir / "target"
-                if target_dir.exists():
-                    shutil.rmtree(target_dir)
+        example_targets = [
+            example_dir / "target"
+            for example_dir in examples_dir.iterdir()
+            if (example_dir / "target").is_dir()
+        ]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            list(pool.map(fast_rmtree, example_targets))
 
     return 0
 
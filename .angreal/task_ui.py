@@ -28,8 +28,6 @@ processes.
 import json
 import subprocess
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -68,6 +66,8 @@ def _compose_fleet(*args) -> int:
 
 def _api(method, path, key=DEMO_BOOTSTRAP_KEY, expect=(200, 201, 409)):
     """Minimal REST helper against the demo server. Returns (status, body)."""
+    import urllib.error
+    import urllib.request
     req = urllib.request.Request(f"{SERVER_URL}{path}", method=method)
     req.add_header("Authorization", f"Bearer {key}")
     try:
@@ -2,13 +2,18 @@ import angreal #type: ignore
 from angreal.integrations.venv import VirtualEnv# type: ignore
 
 
+from collections import deque
 from dataclasses import dataclass
 from typing import List, Optional
+import hashlib
+import os
 import shutil
 from pathlib import Path
 import re
 import subprocess
 
+from ._utils import file_digest
+
 
 # CLOACI-I-0140: EMPTY by design — keep it that way.
 #
@@ -41,7 +46,7 @@ def _looks_like_crash(returncode, stdout, stderr) -> bool:
 
 
 def run_pytest_scenarios(
-    venv,
+    cloaca_env: "CloacaEnv",
     project_root: Path,
     backend_name: str,
     aggregator: "TestAggregator",
@@ -51,7 +56,7 @@ def run_pytest_scenarios(
     """Run all (or filtered) tests/python/test_scenario_*.py against an already-built wheel.
 
     Caller is responsible for:
-      - Building/installing the cloaca wheel into `venv` (use _build_and_install_cloaca_unified).
+      - Building/installing the cloaca wheel into `cloaca_env` (use _build_and_install_cloaca_unified).
       - Bringing up the database for `backend_name` (Docker postgres or local sqlite).
 
     For postgres, this resets the schema between scenario files via smart_postgres_reset
@@ -64,10 +69,9 @@ def run_pytest_scenarios(
     from utils import (  # local import to avoid making this module depend on top-level utils at import time
         docker_up,
         docker_down,
-        check_postgres_container_health,
         smart_postgres_reset,
+        wait_for_postgres,
     )
-    import time
 
     test_dir = project_root / "tests" / "python"
     if file:
@@ -83,7 +87,6 @@ def run_pytest_scenarios(
 
     print(f"Found {len(test_files)} python scenario files to run for {backend_name}")
 
-    pytest_exe = venv.path / "bin" / "pytest"
     env = os.environ.copy()
     env["CLOACA_BACKEND"] = backend_name
 
@@ -100,8 +103,7 @@ def run_pytest_scenarios(
                 print("Fast reset failed, restarting Docker...")
                 docker_down(remove_volumes=True)
                 docker_up()
-                time.sleep(10)
-                if not check_postgres_container_health():
+                if not wait_for_postgres():
                     print(f"PostgreSQL unhealthy for {test_file.name}")
                     file_results.append((test_file.name, False))
                     all_passed = False
@@ -113,7 +115,13 @@ def run_pytest_scenarios(
                 except FileNotFoundError:
                     pass
 
-        cmd = [str(pytest_exe), "--timeout=10", str(test_file), "-v"]
+        # -p no:cacheprovider: each file runs in a fresh pytest process, so
+        # the .pytest_cache read/write round-trip buys nothing. No xdist:
+        # scenario files share one database that is reset between files.
+        cmd = [
+            cloaca_env.pytest, "--timeout=10", str(test_file), "-v",
+            "-p", "no:cacheprovider", "--no-header",
+        ]
         if filter:
             cmd.extend(["-k", filter])
 
@@ -233,11 +241,38 @@ def run_pytest_scenarios(
     return all_passed
 
 
+# Trees `_purge_artifacts` never descends into: cargo output (tens of
+# thousands of files, and `cargo clean` owns it), VCS metadata, and JS deps.
+_PURGE_PRUNE_DIRS = {"target", ".git", "node_modules"}
+
+
+def _purge_artifacts(root: Path) -> int:
+    """Remove every `__pycache__` directory under `root` in one traversal.
+
+    A single top-down `os.walk` classifies each directory once: caches are
+    deleted and pruned, and build/VCS trees are pruned without being entered —
+    `rglob` would otherwise stat every object file under each `target/`.
+
+    Returns the number of `__pycache__` directories removed.
+    """
+    removed = 0
+    for dirpath, dirnames, _filenames in os.walk(root, topdown=True):
+        keep = []
+        for name in dirnames:
+            if name == "__pycache__":
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+                removed += 1
+            elif name not in _PURGE_PRUNE_DIRS:
+                keep.append(name)
+        dirnames[:] = keep
+    return removed
+
+
 def scrub_python_artifacts(deep: bool = False) -> int:
     """Clean Python build artifacts and test environments.
 
     Used by `cloacina purge` (deep=True). Removes:
-    - test venvs (smoke-test-*, test-env-*, debug-env-*, tutorial-*)
+    - test venvs (smoke-test-*, test-env-*, debug-env-*, tutorial-*, python-workflow-demo)
     - __pycache__ directories
     - SQLite *.db files (project root + /tmp/cloacina_*.db)
     Optionally runs `cargo clean` when deep=True.
@@ -248,7 +283,7 @@ def scrub_python_artifacts(deep: bool = False) -> int:
         project_root = Path(angreal.get_root()).parent
 
         envs_cleaned = 0
-        for env_pattern in ["smoke-test-*", "test-env-*", "debug-env-*", "tutorial-*"]:
+        for env_pattern in ["smoke-test-*", "test-env-*", "debug-env-*", "tutorial-*", "python-workflow-demo"]:
             for env_dir in project_root.glob(env_pattern):
                 if env_dir.is_dir():
                     shutil.rmtree(env_dir)
@@ -256,10 +291,7 @@ def scrub_python_artifacts(deep: bool = False) -> int:
         if envs_cleaned:
             print(f"Cleaned {envs_cleaned} test environments")
 
-        caches_cleaned = 0
-        for cache_dir in project_root.rglob("__pycache__"):
-            shutil.rmtree(cache_dir)
-            caches_cleaned += 1
+        caches_cleaned = _purge_artifacts(project_root)
         if caches_cleaned:
             print(f"Cleaned {caches_cleaned} __pycache__ directories")
 
@@ -473,106 +505,255 @@ def normalize_version_for_python(cargo_version: str) -> str:
     return version
 
 
+_VERSION_RE = re.compile(r'\[workspace\.package\].*?version\s*=\s*"([^"]+)"', re.DOTALL)
+
+# (Cargo.toml mtime_ns, version) from the last successful parse.
+_VERSION_CACHE: Optional[tuple] = None
+
+
 def get_workspace_version() -> str:
     """Extract version from workspace Cargo.toml.
 
+    The result is memoized against Cargo.toml's mtime, so repeated calls in
+    one harness run re-read the file only after it changes (e.g. a
+    `release bump` in between).
+
     Returns:
         Version string from workspace configuration
 
     Raises:
         ValueError: If version cannot be found in workspace Cargo.toml
     """
+    global _VERSION_CACHE
+
     project_root = Path(angreal.get_root()).parent
     cargo_toml = project_root / "Cargo.toml"
 
-    if not cargo_toml.exists():
+    try:
+        mtime_ns = cargo_toml.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Workspace Cargo.toml not found at {cargo_toml}")
 
-    content = cargo_toml.read_text()
-    match = re.search(r'\[workspace\.package\].*?version\s*=\s*"([^"]+)"', content, re.DOTALL)
+    if _VERSION_CACHE is not None and _VERSION_CACHE[0] == mtime_ns:
+        return _VERSION_CACHE[1]
+
+    match = _VERSION_RE.search(cargo_toml.read_text())
 
     if match:
-        return match.group(1)
+        _VERSION_CACHE = (mtime_ns, match.group(1))
+        return _VERSION_CACHE[1]
 
     raise ValueError("Could not find version in workspace Cargo.toml")
 
 
-def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
-    """Build unified cloaca wheel and install it in a test environment.
+def _run_quiet(cmd, tail_lines: int = 200, **kwargs) -> int:
+    """Run `cmd` without buffering its output; return the exit code.
 
-    By default the wheel is built with the cloacina-python crate's default
-    features (postgres+sqlite+macros). Pass ``cargo_features`` (e.g.
-    ``"sqlite,macros"``) to scope the wheel to a specific backend — required
-    on the sqlite-only CI lane where libpq has been removed from the runner.
-    Returns the VirtualEnv object and paths to executables.
+    stdout+stderr are drained line by line into a bounded deque instead of
+    being accumulated whole (`capture_output=True` holds megabytes of rustc
+    output for a `maturin build --release` that succeeded). On failure the
+    last `tail_lines` lines are printed; pass 0 for probes whose failure is
+    expected and handled by the caller.
+    """
+    tail = deque(maxlen=tail_lines or 1)
+    with subprocess.Popen(
+        [str(c) for c in cmd],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        **kwargs,
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+    if proc.returncode != 0 and tail_lines:
+        print(f"[DEBUG] command failed (rc={proc.returncode}): {' '.join(str(c) for c in cmd)}", flush=True)
+        print(f"[DEBUG] last {len(tail)} line(s) of output:", flush=True)
+        print("".join(tail), end="", flush=True)
+    return proc.returncode
+
+
+def _run_quiet_checked(cmd, **kwargs) -> None:
+    """`_run_quiet` that raises CalledProcessError on a non-zero exit."""
+    rc = _run_quiet(cmd, **kwargs)
+    if rc != 0:
+        raise subprocess.CalledProcessError(rc, cmd)
+
+
+@dataclass(frozen=True)
+class CloacaEnv:
+    """A provisioned harness venv and its executables.
+
+    Executable paths are stringified once here so callers can drop them
+    straight into subprocess argv lists.
+    """
+    venv: VirtualEnv
+    path: Path
+    python: str
+    pip: str
+    maturin: str
+    pytest: str
+
+    @classmethod
+    def for_venv(cls, venv: VirtualEnv) -> "CloacaEnv":
+        bin_dir = Path(venv.path) / "bin"
+        return cls(
+            venv=venv,
+            path=Path(venv.path),
+            python=str(bin_dir / "python"),
+            pip=str(bin_dir / "pip3"),
+            maturin=str(bin_dir / "maturin"),
+            pytest=str(bin_dir / "pytest"),
+        )
+
+
+# Directories under crates/ that never feed the wheel build — hashing them
+# would only make the cache key churn on test-only edits.
+_WHEEL_CACHE_SKIP_DIRS = {"target", "tests", "test-fixtures", "__pycache__"}
+
+
+def _wheel_cache_key(project_root: Path, cargo_features: Optional[str]) -> str:
+    """Content hash of everything that can change the built cloaca wheel.
+
+    Covers the workspace Cargo.toml + Cargo.lock, every non-test file under
+    crates/ (sources, build.rs, pyproject.toml, embedded migrations), and the
+    cargo feature scope — a sqlite-only wheel must never be served to a
+    postgres run. Files are digested individually (see `file_digest`) in
+    sorted order so the key is stable across machines.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"features={cargo_features or 'default'}\0".encode())
+
+    files = [project_root / "Cargo.toml", project_root / "Cargo.lock"]
+    for dirpath, dirnames, filenames in os.walk(project_root / "crates"):
+        dirnames[:] = sorted(d for d in dirnames if d not in _WHEEL_CACHE_SKIP_DIRS)
+        files.extend(Path(dirpath) / name for name in sorted(filenames))
+
+    for path in files:
+        if not path.is_file():
+            continue
+        h.update(str(path.relative_to(project_root)).encode() + b"\0")
+        h.update(file_digest(path))
+    return h.hexdigest()
+
+
+# Everything a harness venv needs besides the cloaca wheel itself.
+_VENV_DEPS = ["maturin", "pytest", "pytest-asyncio", "pytest-timeout", "psycopg2-binary"]
+
+
+def _ensure_persistent_venv(venv_name):
+    """Create (or reuse) the harness venv at `<repo>/<venv_name>`.
+
+    The venv is long-lived: ensurepip and the dependency install run only when
+    its `.ready` marker is missing or records a different dependency list.
+    Between runs only the cloaca wheel is swapped (see
+    `_build_and_install_cloaca_unified`). `angreal purge` /
+    `services purge` remove the venvs.
+
+    Returns a CloacaEnv.
     """
     project_root = Path(angreal.get_root()).parent
     venv_path = project_root / venv_name
 
-    # Create test environment
     print("[DEBUG] Step 1: Creating test environment...", flush=True)
-    venv = VirtualEnv(path=str(venv_path), now=True)
-    print(f"[DEBUG] Step 1 complete: venv at {venv.path}", flush=True)
+    env = CloacaEnv.for_venv(VirtualEnv(path=str(venv_path), now=True))
+    print(f"[DEBUG] Step 1 complete: venv at {env.path}", flush=True)
 
-    python_exe = venv.path / "bin" / "python"
-    pip_exe = venv.path / "bin" / "pip3"
+    ready_marker = env.path / ".ready"
+    deps_line = " ".join(_VENV_DEPS)
+    if ready_marker.exists() and ready_marker.read_text().strip() == deps_line:
+        print("[DEBUG] Steps 2-3 skipped: venv already provisioned", flush=True)
+        return env
 
     # Install pip and dependencies
     print("[DEBUG] Step 2: Installing pip via ensurepip...", flush=True)
-    subprocess.run([str(python_exe), "-m", "ensurepip"], check=True, capture_output=True)
+    _run_quiet_checked([env.python, "-m", "ensurepip"])
     print("[DEBUG] Step 2 complete", flush=True)
 
-    # Base dependencies for all backends
+    # Base dependencies for all backends. Installed from a local wheelhouse
+    # (.pip-cache/ at the repo root) so warm runs never touch PyPI; the
+    # wheelhouse is (re)filled only when it is empty or can't satisfy the
+    # deps (first run, new interpreter version, new dependency).
     print("[DEBUG] Step 3: Installing dependencies...", flush=True)
-    deps = ["maturin", "pytest", "pytest-asyncio", "pytest-timeout", "psycopg2-binary"]
-    subprocess.run([str(pip_exe), "install"] + deps, check=True, capture_output=True)
+    wheelhouse = str(project_root / ".pip-cache")
+    offline_install = [env.pip, "install", "--no-index", "--find-links", wheelhouse] + _VENV_DEPS
+    if not os.path.isdir(wheelhouse) or _run_quiet(offline_install, tail_lines=0) != 0:
+        print(f"[DEBUG] Step 3: refreshing wheelhouse at {wheelhouse}", flush=True)
+        _run_quiet_checked([env.pip, "download", "-d", wheelhouse] + _VENV_DEPS)
+        _run_quiet_checked(offline_install)
+    ready_marker.write_text(deps_line + "\n")
     print("[DEBUG] Step 3 complete", flush=True)
 
+    return env
+
+
+def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
+    """Build unified cloaca wheel and install it in a test environment.
+
+    By default the wheel is built with the cloacina-python crate's default
+    features (postgres+sqlite+macros). Pass ``cargo_features`` (e.g.
+    ``"sqlite,macros"``) to scope the wheel to a specific backend — required
+    on the sqlite-only CI lane where libpq has been removed from the runner.
+    The venv itself is persistent (`_ensure_persistent_venv`); only the wheel
+    is reinstalled per call.
+    Returns the CloacaEnv holding the venv and its executable paths.
+    """
+    project_root = Path(angreal.get_root()).parent
+    env = _ensure_persistent_venv(venv_name)
+
     # Build and install unified wheel from cloacina-python
     # (pyproject.toml moved there in CLOACI-T-0529 so the Python bindings
     # stop dragging pyo3 through cloacina core).
-    print("[DEBUG] Step 4: Building cloaca wheel from cloacina-python...", flush=True)
-    crate_dir = project_root / "crates" / "cloacina-python"
-
-    # Build wheel using maturin (pyproject.toml is in crates/cloacina-python/)
-    maturin_exe = venv.path / "bin" / "maturin"
-    maturin_cmd = [
-        str(maturin_exe), "build",
-        "--release",
-        "--manylinux", "off",  # skip auditwheel repair (avoids libpq.so resolution)
-    ]
-    if cargo_features:
-        # Scope the wheel to a specific backend (e.g. sqlite-only lane).
-        maturin_cmd += ["--no-default-features", "--features", cargo_features]
-
-    print(f"[DEBUG] Running: {' '.join(maturin_cmd)} in {crate_dir}", flush=True)
-    result = subprocess.run(
-        maturin_cmd,
-        cwd=str(crate_dir),
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"[DEBUG] Maturin STDERR: {result.stderr}", flush=True)
-        print(f"[DEBUG] Maturin STDOUT: {result.stdout}", flush=True)
-        raise subprocess.CalledProcessError(result.returncode, maturin_cmd)
-    print("[DEBUG] Step 4 complete: wheel built", flush=True)
-
-    # Find and install the wheel
-    print("[DEBUG] Step 5: Finding and installing wheel...", flush=True)
+    # Wheels are cached under target/wheels-cache/<content hash>/ — an
+    # edit-test cycle that didn't touch the Rust side (or flips back to a
+    # previously built feature scope) skips maturin entirely.
     wheel_pattern = "cloaca-*.whl"
-    # Maturin puts wheels in the workspace target, not the crate target
-    wheel_dir = project_root / "target" / "wheels"
-    wheel_files = list(wheel_dir.glob(wheel_pattern))
-
-    if not wheel_files:
-        raise FileNotFoundError(f"No wheel found matching {wheel_pattern} in {wheel_dir}")
-
-    # Newest by mtime, not glob order: a backend-scoped run
-    # (`--backend sqlite` builds `--no-default-features --features sqlite`)
-    # can leave an older wheel here, and glob order is arbitrary.
-    wheel_file = max(wheel_files, key=lambda p: p.stat().st_mtime)
-    print(f"[DEBUG] Installing wheel: {wheel_file.name}", flush=True)
+    cache_dir = project_root / "target" / "wheels-cache" / _wheel_cache_key(project_root, cargo_features)
+    cached_wheels = sorted(cache_dir.glob(wheel_pattern)) if cache_dir.is_dir() else []
+
+    if cached_wheels:
+        wheel_file = cached_wheels[0]
+        print(f"[DEBUG] Step 4: reusing cached wheel {wheel_file.name} ({cache_dir.name})", flush=True)
+    else:
+        print("[DEBUG] Step 4: Building cloaca wheel from cloacina-python...", flush=True)
+        crate_dir = project_root / "crates" / "cloacina-python"
+
+        # Build wheel using maturin (pyproject.toml is in crates/cloacina-python/)
+        maturin_cmd = [
+            env.maturin, "build",
+            "--release",
+            "--manylinux", "off",  # skip auditwheel repair (avoids libpq.so resolution)
+        ]
+        if cargo_features:
+            # Scope the wheel to a specific backend (e.g. sqlite-only lane).
+            maturin_cmd += ["--no-default-features", "--features", cargo_features]
+        if os.environ.get("CLOACINA_OFFLINE") == "1":
+            # Opt-in: skip crates.io index checks when the cargo registry is
+            # already warm. Not the default — a cold registry would fail.
+            maturin_cmd.append("--offline")
+
+        print(f"[DEBUG] Running: {' '.join(maturin_cmd)} in {crate_dir}", flush=True)
+        from utils import cargo_env  # local import, as in run_pytest_scenarios
+
+        _run_quiet_checked(maturin_cmd, cwd=str(crate_dir), env=cargo_env())
+        print("[DEBUG] Step 4 complete: wheel built", flush=True)
+
+        # Maturin puts wheels in the workspace target, not the crate target
+        wheel_dir = project_root / "target" / "wheels"
+        wheel_files = list(wheel_dir.glob(wheel_pattern))
+
+        if not wheel_files:
+            raise FileNotFoundError(f"No wheel found matching {wheel_pattern} in {wheel_dir}")
+
+        # Newest by mtime, not glob order: a backend-scoped run
+        # (`--backend sqlite` builds `--no-default-features --features sqlite`)
+        # can leave an older wheel here, and glob order is arbitrary.
+        built_wheel = max(wheel_files, key=lambda p: p.stat().st_mtime)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        wheel_file = Path(shutil.copy(built_wheel, cache_dir / built_wheel.name))
+
+    print(f"[DEBUG] Step 5: Installing wheel: {wheel_file.name}", flush=True)
     # --force-reinstall is REQUIRED, not defensive: the version never changes
     # between builds, so plain `pip install` sees `cloaca 0.10.0` already
     # present and no-ops ("already satisfied") — silently keeping whatever
@@ -583,11 +764,7 @@ def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
     # build. CI never saw this: its runners are fresh and each backend is a
     # separate job, so the venv is always empty. --no-deps because the wheel's
     # deps are already installed above and we only want the wheel replaced.
-    subprocess.run(
-        [str(pip_exe), "install", "--force-reinstall", "--no-deps", str(wheel_file)],
-        check=True,
-        capture_output=True,
-    )
+    _run_quiet_checked([env.pip, "install", "--force-reinstall", "--no-deps", "--no-index", wheel_file])
     print("[DEBUG] Step 5 complete: wheel installed (forced)", flush=True)
 
     # Postcondition: prove the INSTALLED module has the backend the caller
@@ -598,7 +775,7 @@ def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
     # so its presence is a reliable proxy for the postgres feature.
     wants_postgres = cargo_features is None or "postgres" in cargo_features
     probe = subprocess.run(
-        [str(python_exe), "-c", "import cloaca; print(hasattr(cloaca, 'DatabaseAdmin'))"],
+        [env.python, "-c", "import cloaca; print(hasattr(cloaca, 'DatabaseAdmin'))"],
         capture_output=True,
         text=True,
     )
@@ -611,7 +788,7 @@ def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
         raise RuntimeError(
             "installed cloaca wheel has the wrong feature scope: expected "
             f"postgres={wants_postgres}, got postgres={has_postgres}. The venv at "
-            f"{venv.path} likely holds a wheel from a differently-scoped run — "
+            f"{env.path} likely holds a wheel from a differently-scoped run — "
             "remove it and re-run."
         )
     print(
@@ -619,4 +796,4 @@ def _build_and_install_cloaca_unified(venv_name, cargo_features=None):
         flush=True,
     )
 
-    return venv, python_exe, pip_exe
+    return env
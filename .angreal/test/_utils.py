@@ -2,6 +2,14 @@
 Shared utilities for Cloacina core engine test commands.
 """
 
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import angreal  # type: ignore
 
@@ -23,6 +31,139 @@ def print_final_success(message):
     print(f"{'='*50}")
 
 
+def file_digest(path):
+    """blake2b digest of one file's contents, for building cache keys.
+
+    On Python 3.11+ `hashlib.file_digest` runs the read loop in C; older
+    interpreters fall back to `readinto` over a reused 1 MiB buffer.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+        h = hashlib.blake2b(digest_size=16)
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            h.update(buf[:n])
+        return h.digest()
+
+
+NEXTEST_INSTALL_HINT = "install it with `cargo install cargo-nextest --locked`"
+
+
+def default_test_threads():
+    """Test threads for CPU-bound unit runs: all cores but two, at least one."""
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+@lru_cache(maxsize=1)
+def nextest_available():
+    """Return True if cargo-nextest is installed (probed once per process)."""
+    return shutil.which("cargo-nextest") is not None
+
+
+def cargo_unit_test_cmd(crate_args, filter=None, threads=None):
+    """Build the unit-test command for `crate_args` (`-p <crate> --lib ...`).
+
+    Uses `cargo nextest run` when cargo-nextest is installed — every test
+    runs in its own process, so `#[serial]`-style in-process guards never
+    bottleneck the run — and falls back to `cargo test` with an explicit
+    `--test-threads` otherwise.
+    """
+    threads = threads or default_test_threads()
+    if nextest_available():
+        cmd = ["cargo", "nextest", "run"] + crate_args + [
+            "--no-fail-fast", "--no-tests=warn", "-j", str(threads),
+        ]
+        if filter:
+            cmd.append(filter)
+        return cmd
+    cmd = ["cargo", "test"] + crate_args
+    if filter:
+        cmd.append(filter)
+    return cmd + ["--", f"--test-threads={threads}"]
+
+
+# Serializes writes from concurrent run_streaming readers so tagged lines
+# from different lanes never split mid-line.
+_stream_lock = threading.Lock()
+
+
+def _write_out(data):
+    out = getattr(sys.stdout, "buffer", None)
+    with _stream_lock:
+        if out is not None:
+            out.write(data)
+            out.flush()
+        else:
+            sys.stdout.write(data.decode(errors="replace"))
+            sys.stdout.flush()
+
+
+def run_streaming(cmd, tag=None, env=None, cwd=None):
+    """Run `cmd` with stdout+stderr on one pipe, forwarding it as it arrives.
+
+    The pipe is drained in 64 KiB `os.read` blocks and each block goes out in
+    a single write, prefixed per line with `[tag] ` when a tag is given, so
+    concurrent lanes stay readable without waiting for them to finish.
+
+    Returns the command's exit code.
+    """
+    prefix = f"[{tag}] ".encode() if tag else b""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, cwd=cwd)
+    fd = proc.stdout.fileno()
+    pending = b""
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if lines:
+            _write_out(b"".join(prefix + line + b"\n" for line in lines))
+    if pending:
+        _write_out(prefix + pending + b"\n")
+    proc.stdout.close()
+    return proc.wait()
+
+
+def run_lanes(lanes, jobs=None, env=None):
+    """Run independent lanes of commands, concurrently unless `jobs == 1`.
+
+    `lanes` is a list of `(label, [cmd, ...])`; the commands of one lane run
+    in order and the lane stops at its first failure, while separate lanes
+    (e.g. the postgres and sqlite backends) share no state and run side by
+    side. cargo serializes the compile step on its build-dir lock, so the
+    overlap is in the test runs themselves.
+
+    Concurrent lanes stream their output live through `run_streaming`, each
+    line tagged with the lane label; `jobs == 1` runs lanes one after another
+    on the inherited terminal.
+
+    `env` is passed to every command (default: inherit the parent env).
+
+    Returns `[(label, returncode, failed_cmd_or_None), ...]` in `lanes` order.
+    """
+    def _run_lane(label, cmds, tagged):
+        for cmd in cmds:
+            if tagged:
+                rc = run_streaming(cmd, tag=label, env=env)
+            else:
+                rc = subprocess.run(cmd, env=env).returncode
+            if rc != 0:
+                return rc, cmd
+        return 0, None
+
+    if jobs == 1 or len(lanes) == 1:
+        return [(label, *_run_lane(label, cmds, tagged=False)) for label, cmds in lanes]
+
+    with ThreadPoolExecutor(max_workers=jobs or len(lanes)) as pool:
+        futures = [pool.submit(_run_lane, label, cmds, True) for label, cmds in lanes]
+        results = [(label, *future.result()) for (label, _), future in zip(lanes, futures)]
+    for label, rc, _ in results:
+        print(f"[{label}] finished (rc={rc})")
+    return results
+
+
 def wait_for_postgres_stable(
     compose_file=".angreal/docker-compose.yaml",
     cwd=None,
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import angreal  # type: ignore
 
+from utils import docker_session
+
 from .unit import unit
 from .macros import macros
 from .integration import integration
@@ -14,30 +18,40 @@ test = angreal.command_group(name="test", about="Cloacina test suites (unit, int
     when_to_use=["comprehensive testing", "pre-commit validation", "CI/CD full test suite"],
     when_not_to_use=["quick feedback loops", "testing specific features", "debugging individual tests"]
 )
-def all():
+@angreal.argument(
+    name="keep_services",
+    long="keep-services",
+    required=False,
+    takes_value=False,
+    is_flag=True,
+    help="leave the Docker services running afterwards",
+)
+def all(keep_services=False):
     """Run all cloacina core tests (unit, integration, and macro tests)."""
     failed_tests = []
 
-    # Run unit tests first
-    print("=== Running Unit Tests ===")
-    try:
-        unit()
-    except Exception as e:
-        failed_tests.append(f"Unit tests: {str(e)}")
-
-    # Run macro tests
-    print("\n=== Running Macro Tests ===")
-    try:
-        macros()
-    except Exception as e:
-        failed_tests.append(f"Macro tests: {str(e)}")
-
-    # Run integration tests last
-    print("\n=== Running Integration Tests ===")
-    try:
-        integration()
-    except Exception as e:
-        failed_tests.append(f"Integration tests: {str(e)}")
+    # One Docker lifetime for the whole run; integration() sees the ambient
+    # session and skips its own restart/teardown. The bring-up runs in the
+    # background alongside unit and macro tests (neither touches Docker);
+    # integration() waits on it before its first Postgres test.
+    with docker_session(keep_services=keep_services, background=True):
+        # Unit and macro tests share no state (neither touches Docker), so
+        # they run side by side; integration follows once both are done.
+        print("=== Running Unit and Macro Tests ===")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            suites = [("Unit tests", pool.submit(unit)), ("Macro tests", pool.submit(macros))]
+            for label, future in suites:
+                try:
+                    future.result()
+                except Exception as e:
+                    failed_tests.append(f"{label}: {str(e)}")
+
+        # Run integration tests last
+        print("\n=== Running Integration Tests ===")
+        try:
+            integration()
+        except Exception as e:
+            failed_tests.append(f"Integration tests: {str(e)}")
 
     if failed_tests:
         failure_summary = "\n".join(f"- {test}" for test in failed_tests)
@@ -15,8 +15,6 @@ import signal
 import subprocess
 import tempfile
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -50,6 +48,7 @@ def _start_postgres():
 
 
 def _wait_for_health(base_url: str, timeout_s: float = 30.0, server_proc=None):
+    import urllib.request
     deadline = time.time() + timeout_s
     while time.time() < deadline:
         if server_proc is not None and server_proc.poll() is not None:
@@ -105,6 +104,8 @@ def _psql(sql: str) -> str:
     when_not_to_use=["unit testing", "running without docker"],
 )
 def cli():
+    import urllib.error
+    import urllib.request
     print_section_header("cloacinactl e2e")
     _build_binaries()
     _start_postgres()
@@ -27,7 +27,6 @@ import re
 import subprocess
 import tempfile
 import time
-import urllib.request
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -90,6 +89,7 @@ def _wait_http(
     timeout_s: float = 30.0,
     proc: subprocess.Popen | None = None,
 ):
+    import urllib.request
     deadline = time.time() + timeout_s
     while time.time() < deadline:
         try:
@@ -313,6 +313,7 @@ def _poll_build_status(
 def _get_json(url: str, bootstrap_key: str) -> dict:
     """Authenticated GET → parsed JSON. Used to assert on the server's actual
     HTTP response bodies (the API surface the UI/SDK consume)."""
+    import urllib.request
     req = urllib.request.Request(
         url, headers={"Authorization": f"Bearer {bootstrap_key}"}
     )
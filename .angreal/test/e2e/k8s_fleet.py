@@ -44,8 +44,6 @@ import subprocess
 import sys
 import tempfile
 import time
-import urllib.error
-import urllib.request
 import uuid
 from pathlib import Path
 
@@ -131,6 +129,8 @@ def _kubectl_json(args, kubeconfig):
 # ---------------------------------------------------------------------------
 
 def _api(method, path, body=None, expect=(200, 201), base=None):
+    import urllib.error
+    import urllib.request
     url = f"{base}{path}"
     data = json.dumps(body).encode() if body is not None else None
     req = urllib.request.Request(url, data=data, method=method)
@@ -153,6 +153,7 @@ def _api(method, path, body=None, expect=(200, 201), base=None):
 
 
 def _wait_http(url, timeout_s=90, proc=None):
+    import urllib.request
     deadline = time.time() + timeout_s
     while time.time() < deadline:
         if proc is not None and proc.poll() is not None:
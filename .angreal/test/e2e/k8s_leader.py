@@ -63,8 +63,6 @@ import sys
 import tempfile
 import threading
 import time
-import urllib.error
-import urllib.request
 import uuid
 from pathlib import Path
 
@@ -128,6 +126,8 @@ SERVER_SELECTOR = "app.kubernetes.io/name=cloacina-server"
 # ---------------------------------------------------------------------------
 
 def _api(method, path, body=None, expect=(200, 201), base=None):
+    import urllib.error
+    import urllib.request
     url = f"{base}{path}"
     data = json.dumps(body).encode() if body is not None else None
     req = urllib.request.Request(url, data=data, method=method)
@@ -426,6 +426,7 @@ def _deploy_compiler(kubeconfig, compiler_ref):
 
 
 def _upload_package(base, fixture_path):
+    import urllib.request
     boundary = "----CloacinaLeaderE2E"
     body = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; "
             f"filename=\"package.cloacina\"\r\nContent-Type: application/octet-stream\r\n\r\n").encode()
@@ -32,8 +32,6 @@ import shutil
 import subprocess
 import tempfile
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -86,6 +84,7 @@ def _fresh_database():
 
 
 def _wait_http(url, timeout_s=60, proc=None):
+    import urllib.request
     deadline = time.time() + timeout_s
     while time.time() < deadline:
         if proc is not None and proc.poll() is not None:
@@ -205,6 +204,8 @@ def _create_tenant(name: str):
     # specs only do key/account management (no workflow content), so creating the
     # empty tenant with the bootstrap (god) key is enough for connect to reach
     # Overview. (CLOACI-T-0787)
+    import urllib.error
+    import urllib.request
     req = urllib.request.Request(
         f"{SERVER_URL}/v1/tenants",
         data=json.dumps({"name": name}).encode(),
@@ -5,13 +5,11 @@ Bootstraps Postgres, starts the server, connects via WebSocket,
 and verifies auth + endpoint behavior.
 """
 
-import http.client
 import json
 import signal
 import subprocess
 import time
 from pathlib import Path
-from urllib.parse import urlparse
 
 import angreal  # type: ignore
 
@@ -86,6 +84,8 @@ def ws_connect(url, timeout=5):
     We use a raw HTTP upgrade request since we don't want to require
     the `websockets` package.
     """
+    from urllib.parse import urlparse
+    import http.client
     parsed = urlparse(url)
     host = parsed.hostname
     port = parsed.port or 80
@@ -1,16 +1,26 @@
-import shutil
 import subprocess
 import sys
 import os
+import threading
 from pathlib import Path
 
 import angreal  # type: ignore
 
-from utils import docker_up, docker_down, docker_clean
+from utils import (
+    cargo_env,
+    check_postgres_container_health,
+    compose_is_clean,
+    docker_up,
+    docker_clean,
+    docker_session_active,
+    docker_session_wait,
+    wait_for_postgres,
+)
 
 from ._utils import (
     print_section_header,
-    print_final_success
+    print_final_success,
+    run_lanes,
 )
 from ._python_utils import (
     TestAggregator,
@@ -67,11 +77,11 @@ def _build_shipform_fixture(example_rel: str, pkg: str):
         line.strip() == "[patch.crates-io]" for line in original_toml.splitlines()
     )
     if already_patched:
-        subprocess.run(["cargo", "build", "-p", pkg], check=True, cwd=str(example_dir))
+        subprocess.run(["cargo", "build", "-p", pkg], check=True, cwd=str(example_dir), env=cargo_env())
         return
     try:
         cargo_toml.write_text(original_toml + _local_crate_patch_block())
-        subprocess.run(["cargo", "build", "-p", pkg], check=True, cwd=str(example_dir))
+        subprocess.run(["cargo", "build", "-p", pkg], check=True, cwd=str(example_dir), env=cargo_env())
     finally:
         cargo_toml.write_text(original_toml)
         if original_lock is not None:
@@ -119,6 +129,7 @@ def build_test_packages(backend=None):
             ["cargo", "build", "-p", fixture],
             check=True,
             cwd=f"examples/fixtures/{fixture}",
+            env=cargo_env(),
         )
 
     print("Test packages built successfully.")
@@ -170,6 +181,21 @@ test = angreal.command_group(name="test", about="Cloacina test suites (unit, int
     required=False,
     help="run a single tests/python/<name>.py scenario file (still scoped per-backend)",
 )
+@angreal.argument(
+    name="jobs",
+    long="jobs",
+    required=False,
+    help="max backend lanes run concurrently (1 = sequential with live output; default: all)",
+)
+@angreal.argument(
+    name="keep_services",
+    long="keep-services",
+    required=False,
+    takes_value=False,
+    is_flag=True,
+    help="leave the Docker services running afterwards; the next run reuses a healthy Postgres "
+    "(a stack that was already running, e.g. from 'services up', is never torn down)",
+)
 def integration(
     filter=None,
     skip_docker=False,
@@ -177,6 +203,8 @@ def integration(
     features=None,
     skip_python=False,
     python_file=None,
+    jobs=None,
+    keep_services=False,
 ):
     """Run integration tests against PostgreSQL and/or SQLite databases.
 
@@ -186,10 +214,16 @@ def integration(
          cloaca wheel — these exercise the Python binding surface end-to-end.
     Use --skip-python to run only the Rust layer.
 
-    Tests are compiled once with both backends enabled. By default, PostgreSQL
-    tests run first, then SQLite tests run separately to avoid cross-backend
-    interference. Use --backend to run only one backend's tests.
+    Tests are compiled once with both backends enabled. The PostgreSQL and
+    SQLite Rust lanes select disjoint tests and run concurrently (--jobs 1
+    runs them one after another); the Python scenarios then run per backend.
+    Use --backend to run only one backend's tests. Docker is left alone when
+    an enclosing `test all` session owns it. A stack that is already running
+    with a healthy Postgres (`angreal services up`, or a previous
+    --keep-services run) is reused and left running afterwards; only a stack
+    this run brought up is torn down, unless --keep-services is given.
     """
+    jobs = int(jobs) if jobs else None
 
     run_postgres = backend is None or backend == "postgres"
     run_sqlite = backend is None or backend == "sqlite"
@@ -211,51 +245,96 @@ def integration(
         cargo_features = "postgres,macros"
     is_default_features = cargo_features == "postgres,sqlite,macros"
 
-    if is_default_features:
-        build_test_packages()
-    else:
-        build_test_packages(backend=backend)
+    # Start Docker services for PostgreSQL in the background: the fixture
+    # builds and the wheel build below are minutes of cargo work, the
+    # Postgres (re)start is seconds, so it is joined only right before the
+    # first test needs the database.
+    # Inside `test all` an ambient docker_session already owns the services.
+    manage_docker = not skip_docker and run_postgres and not docker_session_active()
+    docker_thread = None
+    docker_exit = []
+    reuse_postgres = []
+    if manage_docker:
+        print_section_header("Starting Docker services (background)")
+
+        def _docker_bringup():
+            # A healthy Postgres is kept and its database recreated once it
+            # is needed (well under a second) instead of paying the
+            # volume wipe + data-dir init (20-40 s). Such a stack was running
+            # before this run, so it is also left running at the end. Anything
+            # else starts from a clean stack; one with no containers or
+            # volumes left already is.
+            if check_postgres_container_health():
+                reuse_postgres.append(True)
+            elif not compose_is_clean():
+                docker_clean()
+            docker_exit.append(docker_up())
+
+        docker_thread = threading.Thread(target=_docker_bringup, name="docker-bringup", daemon=True)
+        docker_thread.start()
 
     project_root = Path(angreal.get_root()).parent
     venv_name = "test-env-unified"
-    venv_path = project_root / venv_name
-    py_venv = None
+    py_env = None
     py_aggregator = TestAggregator()
     python_failures = 0
 
-    if not skip_python:
-        try:
-            print_section_header("Building unified cloaca wheel for Python scenarios")
-            # Pass the cargo feature set through so the wheel matches the
-            # lane. Otherwise a sqlite-only lane builds the wheel with
-            # maturin's defaults (postgres+sqlite+macros) and the resulting
-            # libcloacina.so fails to link when libpq has been removed from
-            # the runner to verify sqlite-only purity.
-            py_venv, _python_exe, _pip_exe = _build_and_install_cloaca_unified(
-                venv_name, cargo_features=cargo_features if not is_default_features else None,
-            )
-        except Exception as e:
-            print(f"Failed to build cloaca wheel for Python scenarios: {e}", file=sys.stderr)
-            if venv_path.exists():
-                shutil.rmtree(venv_path, ignore_errors=True)
-            raise
-
-    if not skip_docker and run_postgres:
-        # Start Docker services for PostgreSQL
-        print_section_header("Starting Docker services")
-        docker_down()
-        docker_clean()
-        exit_code = docker_up()
-        if exit_code != 0:
+    try:
+        if is_default_features:
+            build_test_packages()
+        else:
+            build_test_packages(backend=backend)
+
+        if not skip_python:
+            try:
+                print_section_header("Building unified cloaca wheel for Python scenarios")
+                # Pass the cargo feature set through so the wheel matches the
+                # lane. Otherwise a sqlite-only lane builds the wheel with
+                # maturin's defaults (postgres+sqlite+macros) and the resulting
+                # libcloacina.so fails to link when libpq has been removed from
+                # the runner to verify sqlite-only purity.
+                py_env = _build_and_install_cloaca_unified(
+                    venv_name, cargo_features=cargo_features if not is_default_features else None,
+                )
+            except Exception as e:
+                print(f"Failed to build cloaca wheel for Python scenarios: {e}", file=sys.stderr)
+                raise
+    except Exception:
+        if docker_thread is not None:
+            docker_thread.join()
+            if not (keep_services or reuse_postgres):
+                docker_clean()
+        raise
+
+    if docker_thread is not None:
+        docker_thread.join()
+        if docker_exit != [0]:
             raise RuntimeError("Docker setup failed")
         # Wait for services to be ready. CLOACI-T-0806: a blind sleep(30)
         # let one lane fire psql inside Postgres's init-restart bounce (exit
         # 56, run 28125071912) — require consecutive pg_isready successes
         # instead (also usually much faster than 30s).
+        # The in-process probe (backoff from 100 ms) sees the server come up
+        # without a `docker compose exec` per attempt; the stable check then
+        # only has to rule out the bounce.
         print("Waiting for PostgreSQL to be stably ready...")
-        from ._utils import wait_for_postgres_stable
-
-        wait_for_postgres_stable()
+        from ._utils import psql_retry, wait_for_postgres_stable
+
+        if not wait_for_postgres():
+            raise RuntimeError("PostgreSQL did not become ready")
+        if reuse_postgres:
+            # Already healthy before we started: no init-restart to wait out.
+            print("Reusing running PostgreSQL; recreating the cloacina database...")
+            psql_retry([
+                "-c", "DROP DATABASE IF EXISTS cloacina WITH (FORCE);",
+                "-c", "CREATE DATABASE cloacina OWNER cloacina;",
+            ])
+        else:
+            wait_for_postgres_stable()
+    elif run_postgres and not skip_docker and docker_session_active():
+        # `test all` may still be bringing its shared stack up in the
+        # background; the builds above overlapped it, now Postgres is needed.
+        docker_session_wait()
 
     try:
         # Build feature flags - use --no-default-features for non-default feature sets
@@ -263,8 +342,11 @@ def integration(
         if not is_default_features:
             feature_args = ["--no-default-features"] + feature_args
 
+        # Rust layer: one lane per backend, run side by side — the postgres
+        # and sqlite test sets are disjoint (`--skip sqlite` / `sqlite`) and
+        # share no database.
+        rust_lanes = []
         for backend_name in backends_to_run:
-            print_section_header(f"Running {backend_name.title()} Rust integration tests")
             cargo_cmd = ["cargo", "test", "-p", "cloacina", "--test", "integration"] + feature_args
             if backend_name == "postgres":
                 cargo_cmd += ["--", "--test-threads=1", "--nocapture", "--skip", "sqlite"]
@@ -272,25 +354,38 @@ def integration(
                 cargo_cmd += ["--", "--test-threads=1", "--nocapture", "sqlite"]
             if filter:
                 cargo_cmd.append(filter)
-            subprocess.run(cargo_cmd, check=True)
+            lane = [cargo_cmd]
 
             # cloacina-server lib tests (CLOACI-T-0636). These are DB-backed
             # router/handler/metrics tests living in cloacina-server's lib
             # target; they need Postgres (the server is Postgres-only) so they
-            # run only in the postgres lane. Previously orphaned — no suite ran
-            # them, so they drifted.
+            # run only in the postgres lane, after the cloacina tests that
+            # share that database. Previously orphaned — no suite ran them,
+            # so they drifted.
             if backend_name == "postgres":
-                print_section_header("Running cloacina-server lib tests (Postgres)")
                 server_cmd = ["cargo", "test", "-p", "cloacina-server", "--lib"]
                 if filter:
                     server_cmd.append(filter)
                 server_cmd += ["--", "--test-threads=1"]
-                subprocess.run(server_cmd, check=True)
+                lane.append(server_cmd)
+            rust_lanes.append((backend_name, lane))
+
+        print_section_header(
+            "Running Rust integration tests (" + ", ".join(b for b, _ in rust_lanes) + ")"
+        )
+        for backend_name, rc, failed_cmd in run_lanes(rust_lanes, jobs=jobs, env=cargo_env()):
+            if rc != 0:
+                print(
+                    f"{backend_name} Rust integration lane failed: {' '.join(failed_cmd)}",
+                    file=sys.stderr,
+                )
+                raise RuntimeError(f"Integration tests failed with return code {rc}")
 
-            if not skip_python:
+        if not skip_python:
+            for backend_name in backends_to_run:
                 print_section_header(f"Running {backend_name.title()} Python pytest scenarios")
                 ok = run_pytest_scenarios(
-                    venv=py_venv,
+                    cloaca_env=py_env,
                     project_root=project_root,
                     backend_name=backend_name,
                     aggregator=py_aggregator,
@@ -307,18 +402,11 @@ def integration(
 
         print_final_success("All integration tests passed!")
 
-        # CLOACI-I-0140: clean the venv ONLY on success. On failure it must
-        # survive — CI's core-dump analysis step needs the (unstripped)
-        # cloaca .so inside it to symbolize backtraces; the old finally-block
-        # cleanup was exactly why every nightly segfault core came out
-        # symbol-less.
-        if py_venv is not None and venv_path.exists():
-            print(f"\nCleaning up Python test environment: {venv_name}")
-            shutil.rmtree(venv_path, ignore_errors=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Integration tests failed with error: {e}", file=sys.stderr)
-        raise RuntimeError(f"Integration tests failed with return code {e.returncode}")
+        # The venv is persistent (see _ensure_persistent_venv) and is never
+        # removed here. CLOACI-I-0140 also depends on it surviving failures —
+        # CI's core-dump analysis step needs the (unstripped) cloaca .so
+        # inside it to symbolize backtraces.
     finally:
-        if not skip_docker and run_postgres:
-            docker_down()
+        # Only tear down a stack this run started; a reused one stays as found.
+        if manage_docker and not (keep_services or reuse_postgres):
             docker_clean()
@@ -34,7 +34,6 @@ import re
 import subprocess
 import tempfile
 import time
-import urllib.request
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -82,6 +81,7 @@ TARGET_INFLIGHT = int(
 
 def _scrape(url: str) -> str:
     """Fetch the Prometheus text exposition; '' on transient failure."""
+    import urllib.request
     try:
         with urllib.request.urlopen(url, timeout=5) as r:
             return r.read().decode()
@@ -58,8 +58,6 @@ import re
 import subprocess
 import tempfile
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 # Strip ANSI color codes so substring log checks are reliable (the server
@@ -110,6 +108,8 @@ def _compose(soak_override, *args, check=True, capture=False):
 
 
 def _api(method, path, body=None):
+    import urllib.error
+    import urllib.request
     data = json.dumps(body).encode() if body is not None else None
     req = urllib.request.Request(f"{BASE_URL}{path}", method=method, data=data)
     req.add_header("Authorization", f"Bearer {BOOTSTRAP_KEY}")
@@ -128,6 +128,8 @@ def _api(method, path, body=None):
 
 
 def _ready_code():
+    import urllib.error
+    import urllib.request
     try:
         with urllib.request.urlopen(f"{BASE_URL}/ready", timeout=5) as r:
             return r.status
@@ -151,6 +153,7 @@ def _wait_health(timeout_s=240):
 
 
 def _scrape_metrics():
+    import urllib.request
     try:
         with urllib.request.urlopen(f"{BASE_URL}/metrics", timeout=5) as r:
             return r.read().decode()
@@ -270,6 +273,8 @@ def _server_log_since(soak_override, since="0s"):
 )
 def fleet_actuator(duration=None, no_build=False):
     """Run the fleet control-plane soak against the fleet-actuator demo variant."""
+    import urllib.error
+    import urllib.request
     dur = int(duration) if duration else DURATION_S
 
     print_section_header("Fleet Control-Plane Soak (Docker actuator)")
@@ -17,8 +17,6 @@ adding a Kafka soak compose-profile is the tracked follow-up.
 import json
 import subprocess
 import time
-import urllib.request
-import urllib.error
 from pathlib import Path
 
 import angreal  # type: ignore
@@ -57,6 +55,8 @@ REQUIRED_PACKAGES = [
 
 def api_request(method, url, token=None, data=None, files=None):
     """Make an HTTP request and return (status_code, json_body)."""
+    import urllib.error
+    import urllib.request
     headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
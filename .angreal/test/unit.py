@@ -1,10 +1,16 @@
-import subprocess
 import sys
 import angreal  # type: ignore
 
+from utils import cargo_env
+
 from ._utils import (
+    NEXTEST_INSTALL_HINT,
+    cargo_unit_test_cmd,
+    default_test_threads,
+    nextest_available,
     print_section_header,
-    print_final_success
+    print_final_success,
+    run_lanes,
 )
 
 test = angreal.command_group(name="test", about="Cloacina test suites (unit, integration, e2e, soak)")
@@ -28,53 +34,48 @@ test = angreal.command_group(name="test", about="Cloacina test suites (unit, int
     required=False,
     help="(ignored) backend parameter for CI compatibility - tests run with both backends"
 )
-def unit(filter=None, backend=None):
+@angreal.argument(
+    name="jobs",
+    long="jobs",
+    required=False,
+    help="max crates tested concurrently (1 = sequential with live output; default: all)"
+)
+def unit(filter=None, backend=None, jobs=None):
     """Run unit tests (tests embedded in src/ modules only).
 
-    Tests are compiled once with both PostgreSQL and SQLite backends enabled.
-    The --backend parameter is accepted for CI compatibility but ignored.
+    Tests are compiled once with both PostgreSQL and SQLite backends enabled
+    and run with cargo-nextest (falling back to cargo test) on all cores but
+    two. The --backend parameter is accepted for CI compatibility but ignored.
     """
 
     print_section_header("Running unit tests")
+    jobs = int(jobs) if jobs else None
 
-    # Run cloacina-workflow unit tests first (minimal crate, no features needed)
-    print("Running cloacina-workflow unit tests...")
-    workflow_cmd = ["cargo", "test", "-p", "cloacina-workflow", "--lib"]
-    if filter:
-        workflow_cmd.append(filter)
-
-    try:
-        subprocess.run(workflow_cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"cloacina-workflow unit tests failed with error: {e}", file=sys.stderr)
-        raise RuntimeError(f"Unit tests failed with return code {e.returncode}")
+    if not nextest_available():
+        print(f"cargo-nextest not found, falling back to cargo test ({NEXTEST_INSTALL_HINT})")
+    threads = default_test_threads()
 
-    # Run cloacina unit tests
-    print("Running cloacina unit tests...")
-    cmd = ["cargo", "test", "-p", "cloacina", "--lib", "--features", "postgres,sqlite,macros"]
-    if filter:
-        cmd.append(filter)
-
-    try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Unit tests failed with error: {e}", file=sys.stderr)
-        raise RuntimeError(f"Unit tests failed with return code {e.returncode}")
-
-    # Run cloacinactl unit tests. Previously in NO lane at all — two scaffold
-    # tests sat failing for three minors with CI green (found during 0.10.0
-    # release prep). Feature set mirrors the distributed CLI build.
-    print("Running cloacinactl unit tests...")
-    ctl_cmd = [
-        "cargo", "test", "-p", "cloacinactl",
-        "--no-default-features", "--features", "postgres,sqlite",
+    lanes = [
+        # cloacina-workflow: minimal crate, no features needed.
+        ("cloacina-workflow", ["-p", "cloacina-workflow", "--lib"]),
+        # cloacina: both backends + macros.
+        ("cloacina", ["-p", "cloacina", "--lib", "--features", "postgres,sqlite,macros"]),
+        # cloacinactl: previously in NO lane at all — two scaffold tests sat
+        # failing for three minors with CI green (found during 0.10.0 release
+        # prep). Feature set mirrors the distributed CLI build.
+        ("cloacinactl", ["-p", "cloacinactl", "--no-default-features", "--features", "postgres,sqlite"]),
     ]
-    if filter:
-        ctl_cmd.append(filter)
+    lanes = [
+        (label, [cargo_unit_test_cmd(crate_args, filter=filter, threads=threads)])
+        for label, crate_args in lanes
+    ]
+
+    # The three crates' unit tests are independent; run them side by side
+    # (--jobs 1 runs them in order with live output).
+    failed = [(label, rc) for label, rc, _ in run_lanes(lanes, jobs=jobs, env=cargo_env()) if rc != 0]
+    if failed:
+        for label, rc in failed:
+            print(f"{label} unit tests failed with return code {rc}", file=sys.stderr)
+        raise RuntimeError(f"Unit tests failed with return code {failed[0][1]}")
 
-    try:
-        subprocess.run(ctl_cmd, check=True)
-        print_final_success("All unit tests passed!")
-    except subprocess.CalledProcessError as e:
-        print(f"cloacinactl unit tests failed with error: {e}", file=sys.stderr)
-        raise RuntimeError(f"Unit tests failed with return code {e.returncode}")
+    print_final_success("All unit tests passed!")
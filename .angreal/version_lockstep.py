@@ -40,12 +40,27 @@ _HELM_CHARTS = [
 ]
 
 
+# rel path -> (st_mtime_ns, text). `check` reads every touchpoint twice (the
+# drift scan, then the OK summary) and `bump` re-verifies after writing;
+# an unchanged file is only read once per process.
+_text_cache = {}
+
+
 def _read(rel: str) -> str:
-    return (PROJECT_ROOT / rel).read_text()
+    path = PROJECT_ROOT / rel
+    mtime = path.stat().st_mtime_ns
+    cached = _text_cache.get(rel)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    text = path.read_text()
+    _text_cache[rel] = (mtime, text)
+    return text
 
 
 def _write(rel: str, text: str) -> None:
-    (PROJECT_ROOT / rel).write_text(text)
+    path = PROJECT_ROOT / rel
+    path.write_text(text)
+    _text_cache[rel] = (path.stat().st_mtime_ns, text)
 
 
 def _minor(v: str) -> str:
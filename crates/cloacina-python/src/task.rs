@@ -289,11 +289,17 @@ impl cloacina::Task for PythonTaskWrapper {
     ) -> Result<cloacina::Context<serde_json::Value>, cloacina::TaskError> {
         use super::context::PyContext;
 
-        let function = Python::with_gil(|py| self.python_function.clone_ref(py));
-        let on_success =
-            Python::with_gil(|py| self.on_success_callback.as_ref().map(|f| f.clone_ref(py)));
-        let on_failure =
-            Python::with_gil(|py| self.on_failure_callback.as_ref().map(|f| f.clone_ref(py)));
+        // One GIL acquisition for every handle this invocation needs, rather
+        // than one per clone — each acquire contends with whatever Python
+        // work the other executor slots are doing.
+        let (function, on_success, on_failure, on_failure_for_body) = Python::with_gil(|py| {
+            (
+                self.python_function.clone_ref(py),
+                self.on_success_callback.as_ref().map(|f| f.clone_ref(py)),
+                self.on_failure_callback.as_ref().map(|f| f.clone_ref(py)),
+                self.on_failure_callback.as_ref().map(|f| f.clone_ref(py)),
+            )
+        });
         let task_id = self.id.clone();
         let task_id_for_error = self.id.clone();
         let needs_handle = self.requires_handle;
@@ -308,8 +314,6 @@ impl cloacina::Task for PythonTaskWrapper {
         //    GIL). on_success / post_invocation / CG invocation all happen
         //    later in the async caller so the graph can be `.await`ed.
         let task_id_for_body = task_id.clone();
-        let on_failure_for_body =
-            Python::with_gil(|py| on_failure.as_ref().map(|f| f.clone_ref(py)));
         let (mut final_context, returned_handle) = tokio::task::spawn_blocking(move || {
             Python::with_gil(|py| {
                 let original_data = context.data().clone();
@@ -339,11 +343,9 @@ impl cloacina::Task for PythonTaskWrapper {
                 match result {
                     Ok(returned) => {
                         let final_context = if returned.is_none(py) {
-                            let mut new_context = cloacina::Context::new();
-                            for (key, value) in original_data.iter() {
-                                new_context.insert(key.clone(), value.clone()).unwrap();
-                            }
-                            new_context
+                            // The snapshot is already an owned copy — move it
+                            // in rather than cloning every key/value again.
+                            cloacina::Context::from_data(original_data)
                         } else {
                             let returned_context: PyContext =
                                 returned.extract(py).map_err(|e| {
@@ -177,47 +177,81 @@ impl<'a> TaskExecutionDAL<'a> {
     ///
     /// Ready tasks are picked up by the push dispatcher's ready-task scan
     /// (`get_ready_for_retry`); there is no separate work-distribution queue.
+    /// A single-id [`mark_ready_batch`](Self::mark_ready_batch).
     pub async fn mark_ready(&self, task_id: UniversalUuid) -> Result<(), ValidationError> {
+        self.mark_ready_batch(vec![task_id]).await
+    }
+
+    /// Marks several tasks as ready for execution in one transaction.
+    ///
+    /// The status flip is a single `UPDATE ... WHERE id IN (...)` and one
+    /// `TaskMarkedReady` event is written per task in the same transaction, so
+    /// a scheduler tick that readies N tasks pays for one commit (one fsync on
+    /// SQLite) instead of N. Duplicate ids are readied once.
+    ///
+    /// All or nothing: if any id does not exist the whole batch is rolled back
+    /// and the not-found error is returned, as [`mark_ready`](Self::mark_ready)
+    /// does for a single missing id.
+    pub async fn mark_ready_batch(
+        &self,
+        mut task_ids: Vec<UniversalUuid>,
+    ) -> Result<(), ValidationError> {
         use diesel::connection::Connection;
 
+        let mut seen = std::collections::HashSet::new();
+        task_ids.retain(|id| seen.insert(*id));
+        if task_ids.is_empty() {
+            return Ok(());
+        }
+
+        let count = task_ids.len();
         crate::interact_on_backend!(self.dal, |conn| {
             conn.transaction::<_, diesel::result::Error, _>(|conn| {
                 let now = UniversalTimestamp::now();
 
-                // Get task info for event
-                let task: UnifiedTaskExecution =
-                    task_executions::table.find(task_id).first(conn)?;
+                // Get task info for events
+                let tasks: Vec<(UniversalUuid, UniversalUuid)> = task_executions::table
+                    .filter(task_executions::id.eq_any(&task_ids))
+                    .select((task_executions::id, task_executions::workflow_execution_id))
+                    .load(conn)?;
+                if tasks.len() != count {
+                    return Err(diesel::result::Error::NotFound);
+                }
 
-                // Update task status
-                diesel::update(task_executions::table.find(task_id))
-                    .set((
-                        task_executions::status.eq("Ready"),
-                        task_executions::updated_at.eq(now),
-                    ))
-                    .execute(conn)?;
+                // Update all task statuses at once
+                diesel::update(
+                    task_executions::table.filter(task_executions::id.eq_any(&task_ids)),
+                )
+                .set((
+                    task_executions::status.eq("Ready"),
+                    task_executions::updated_at.eq(now),
+                ))
+                .execute(conn)?;
 
-                // Insert execution event
-                let event = NewUnifiedExecutionEvent {
-                    id: UniversalUuid::new_v4(),
-                    workflow_execution_id: task.workflow_execution_id,
-                    task_execution_id: Some(task_id),
-                    event_type: ExecutionEventType::TaskMarkedReady.as_str().to_string(),
-                    event_data: None,
-                    worker_id: None,
-                    created_at: now,
-                    request_id: None,
-                    runner_id: None,
-                    tenant_id: None,
-                };
-                diesel::insert_into(execution_events::table)
-                    .values(&event)
-                    .execute(conn)?;
+                // Insert execution events
+                for (task_id, workflow_execution_id) in tasks {
+                    let event = NewUnifiedExecutionEvent {
+                        id: UniversalUuid::new_v4(),
+                        workflow_execution_id,
+                        task_execution_id: Some(task_id),
+                        event_type: ExecutionEventType::TaskMarkedReady.as_str().to_string(),
+                        event_data: None,
+                        worker_id: None,
+                        created_at: now,
+                        request_id: None,
+                        runner_id: None,
+                        tenant_id: None,
+                    };
+                    diesel::insert_into(execution_events::table)
+                        .values(&event)
+                        .execute(conn)?;
+                }
 
                 Ok(())
             })
         })?;
 
-        tracing::debug!(task_id = %task_id, "Task marked as Ready");
+        tracing::debug!(count, "Tasks marked as Ready");
         Ok(())
     }
 
@@ -477,3 +511,132 @@ impl<'a> TaskExecutionDAL<'a> {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use crate::dal::DAL;
+    use crate::database::universal_types::UniversalUuid;
+    use crate::database::Database;
+    use crate::models::execution_event::ExecutionEventType;
+    use crate::models::task_execution::NewTaskExecution;
+    use crate::models::workflow_execution::NewWorkflowExecution;
+
+    #[cfg(feature = "sqlite")]
+    async fn unique_dal() -> DAL {
+        let url = format!(
+            "file:state_test_{}?mode=memory&cache=shared",
+            uuid::Uuid::new_v4()
+        );
+        let db = Database::new(&url, "", 5);
+        db.run_migrations()
+            .await
+            .expect("migrations should succeed");
+        DAL::new(db)
+    }
+
+    /// Helper: create a workflow execution and return its ID.
+    #[cfg(feature = "sqlite")]
+    async fn create_workflow(dal: &DAL) -> UniversalUuid {
+        dal.workflow_execution()
+            .create(NewWorkflowExecution {
+                workflow_name: "state_workflow".into(),
+                workflow_version: "1.0".into(),
+                status: "Running".into(),
+                context_id: None,
+            })
+            .await
+            .unwrap()
+            .id
+    }
+
+    /// Helper: create a NotStarted task, returning its ID.
+    #[cfg(feature = "sqlite")]
+    async fn create_task(dal: &DAL, workflow_id: UniversalUuid, name: &str) -> UniversalUuid {
+        dal.task_execution()
+            .create(NewTaskExecution {
+                workflow_execution_id: workflow_id,
+                task_name: name.into(),
+                status: "NotStarted".into(),
+                attempt: 1,
+                max_attempts: 3,
+                trigger_rules: r#"{"type":"Always"}"#.into(),
+                task_configuration: "{}".into(),
+            })
+            .await
+            .unwrap()
+            .id
+    }
+
+    /// Number of `TaskMarkedReady` events recorded for a task.
+    #[cfg(feature = "sqlite")]
+    async fn ready_events(dal: &DAL, task_id: UniversalUuid) -> usize {
+        dal.execution_event()
+            .list_by_task(task_id)
+            .await
+            .unwrap()
+            .iter()
+            .filter(|e| e.event_type == ExecutionEventType::TaskMarkedReady.as_str())
+            .count()
+    }
+
+    // ── mark_ready_batch ───────────────────────────────────────────
+
+    #[cfg(feature = "sqlite")]
+    #[tokio::test]
+    async fn test_mark_ready_batch_readies_every_task() {
+        let dal = unique_dal().await;
+        let workflow_id = create_workflow(&dal).await;
+        let mut task_ids = Vec::new();
+        for name in ["a", "b", "c"] {
+            task_ids.push(create_task(&dal, workflow_id, name).await);
+        }
+
+        // A duplicate id is readied (and evented) only once.
+        let mut batch = task_ids.clone();
+        batch.push(task_ids[0]);
+        dal.task_execution().mark_ready_batch(batch).await.unwrap();
+
+        for &task_id in &task_ids {
+            let task = dal.task_execution().get_by_id(task_id).await.unwrap();
+            assert_eq!(task.status, "Ready");
+            assert_eq!(ready_events(&dal, task_id).await, 1);
+        }
+    }
+
+    #[cfg(feature = "sqlite")]
+    #[tokio::test]
+    async fn test_mark_ready_batch_missing_id_rolls_back() {
+        let dal = unique_dal().await;
+        let workflow_id = create_workflow(&dal).await;
+        let task_id = create_task(&dal, workflow_id, "present").await;
+
+        let result = dal
+            .task_execution()
+            .mark_ready_batch(vec![task_id, UniversalUuid::new_v4()])
+            .await;
+        assert!(result.is_err());
+
+        let task = dal.task_execution().get_by_id(task_id).await.unwrap();
+        assert_eq!(task.status, "NotStarted");
+        assert_eq!(ready_events(&dal, task_id).await, 0);
+    }
+
+    #[cfg(feature = "sqlite")]
+    #[tokio::test]
+    async fn test_mark_ready_single_task() {
+        let dal = unique_dal().await;
+        let workflow_id = create_workflow(&dal).await;
+        let task_id = create_task(&dal, workflow_id, "solo").await;
+
+        dal.task_execution().mark_ready(task_id).await.unwrap();
+
+        let task = dal.task_execution().get_by_id(task_id).await.unwrap();
+        assert_eq!(task.status, "Ready");
+        assert_eq!(ready_events(&dal, task_id).await, 1);
+        assert!(dal
+            .task_execution()
+            .mark_ready(UniversalUuid::new_v4())
+            .await
+            .is_err());
+    }
+}
@@ -93,6 +93,51 @@ use deadpool_diesel::sqlite::{
 #[cfg(feature = "sqlite")]
 const SQLITE_POOL_SIZE: usize = 4;
 
+/// Per-connection SQLite pragmas, applied on every checkout and before
+/// migrations by [`apply_sqlite_pragmas`]. `busy_timeout` makes a locked
+/// writer wait 30s instead of failing; WAL lets readers proceed during a
+/// write; and `synchronous=NORMAL` drops the fsync from every commit (WAL
+/// syncs at checkpoint instead) — still corruption-safe in WAL mode, only the
+/// last commits before a power loss can roll back.
+///
+/// `busy_timeout` comes first: switching to WAL can itself hit SQLITE_BUSY
+/// when several pooled connections open a fresh database at once, and the
+/// timeout must already be in place for that (and every later) statement.
+#[cfg(feature = "sqlite")]
+const SQLITE_CONNECTION_PRAGMAS: [&str; 3] = [
+    "PRAGMA busy_timeout=30000;",
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+];
+
+/// Applies [`SQLITE_CONNECTION_PRAGMAS`] to `conn`, one statement at a time.
+///
+/// Every pragma is attempted even if an earlier one fails, so a transient
+/// failure of one (e.g. the WAL switch) never leaves the connection without
+/// the others. Returns the failures joined into one message.
+#[cfg(feature = "sqlite")]
+fn apply_sqlite_pragmas(conn: &mut diesel::sqlite::SqliteConnection) -> Result<(), String> {
+    use diesel::connection::SimpleConnection;
+
+    let failures: Vec<String> = SQLITE_CONNECTION_PRAGMAS
+        .iter()
+        .filter_map(|pragma| {
+            conn.batch_execute(pragma)
+                .err()
+                .map(|e| format!("{}: {}", pragma, e))
+        })
+        .collect();
+
+    if failures.is_empty() {
+        Ok(())
+    } else {
+        Err(format!(
+            "Failed to set SQLite pragmas: {}",
+            failures.join("; ")
+        ))
+    }
+}
+
 /// Bounded wait for a pool connection. Without it, an exhausted or contended
 /// pool (especially the small SQLite pool) waits *indefinitely* for a
 /// connection — a reentrant/contended checkout then stalls until some outer
@@ -667,17 +712,8 @@ impl Database {
             AnyPool::Sqlite(pool) => {
                 let conn = pool.get().await.map_err(|e| e.to_string())?;
                 conn.interact(|conn| {
-                    use diesel::prelude::*;
-
                     // Set SQLite pragmas for better concurrency before running migrations
-                    // WAL mode allows concurrent reads during writes
-                    diesel::sql_query("PRAGMA journal_mode=WAL;")
-                        .execute(conn)
-                        .map_err(|e| format!("Failed to set WAL mode: {}", e))?;
-                    // busy_timeout makes SQLite wait 30s instead of immediately failing on locks
-                    diesel::sql_query("PRAGMA busy_timeout=30000;")
-                        .execute(conn)
-                        .map_err(|e| format!("Failed to set busy_timeout: {}", e))?;
+                    apply_sqlite_pragmas(conn)?;
 
                     conn.run_pending_migrations(crate::database::SQLITE_MIGRATIONS)
                         .map(|_| ())
@@ -705,14 +741,7 @@ impl Database {
         {
             let conn = self.pool.get().await.map_err(|e| e.to_string())?;
             conn.interact(|conn| {
-                use diesel::prelude::*;
-
-                diesel::sql_query("PRAGMA journal_mode=WAL;")
-                    .execute(conn)
-                    .map_err(|e| format!("Failed to set WAL mode: {}", e))?;
-                diesel::sql_query("PRAGMA busy_timeout=30000;")
-                    .execute(conn)
-                    .map_err(|e| format!("Failed to set busy_timeout: {}", e))?;
+                apply_sqlite_pragmas(conn)?;
 
                 conn.run_pending_migrations(crate::database::SQLITE_MIGRATIONS)
                     .map(|_| ())
@@ -971,11 +1000,11 @@ impl Database {
 
         let conn = pool.get().await?;
         // Ensure SQLite pragmas are set on every checkout — pragmas are per-connection
-        // and may be lost if the pool recycles the connection.
+        // and may be lost if the pool recycles the connection (see SQLITE_CONNECTION_PRAGMAS).
         conn.interact(|conn| {
-            use diesel::prelude::*;
-            let _ = diesel::sql_query("PRAGMA journal_mode=WAL;").execute(conn);
-            let _ = diesel::sql_query("PRAGMA busy_timeout=30000;").execute(conn);
+            if let Err(e) = apply_sqlite_pragmas(conn) {
+                warn!("{}", e);
+            }
         })
         .await
         .ok();
@@ -190,6 +190,9 @@ pub struct TaskScheduler {
     dispatcher: Option<Arc<dyn Dispatcher>>,
     /// Shutdown signal for graceful termination of the scheduling loop.
     shutdown_rx: Option<tokio::sync::watch::Receiver<bool>>,
+    /// Signalled whenever this scheduler moves a workflow execution to a
+    /// terminal state, so in-process waiters wake without polling.
+    completion: Arc<tokio::sync::Notify>,
 }
 
 impl TaskScheduler {
@@ -252,6 +255,7 @@ impl TaskScheduler {
             poll_interval,
             dispatcher: None,
             shutdown_rx: None,
+            completion: Arc::new(tokio::sync::Notify::new()),
         }
     }
 
@@ -294,6 +298,16 @@ impl TaskScheduler {
         self.dispatcher.as_ref()
     }
 
+    /// Returns the signal notified each time this scheduler completes or
+    /// fails a workflow execution.
+    ///
+    /// Waiters should still re-check status on a fallback interval: executions
+    /// finished by another scheduler instance (e.g. a second server sharing the
+    /// same Postgres database) are not signalled here.
+    pub fn completion_notify(&self) -> &Arc<tokio::sync::Notify> {
+        &self.completion
+    }
+
     /// Schedules a new workflow execution with the provided input context.
     ///
     /// This method:
@@ -595,7 +609,8 @@ impl TaskScheduler {
             self.instance_id,
             self.poll_interval,
             self.dispatcher.clone(),
-        );
+        )
+        .with_completion_notify(self.completion.clone());
         if let Some(ref shutdown_rx) = self.shutdown_rx {
             scheduler_loop = scheduler_loop.with_shutdown(shutdown_rx.clone());
         }
@@ -610,7 +625,8 @@ impl TaskScheduler {
             self.instance_id,
             self.poll_interval,
             self.dispatcher.clone(),
-        );
+        )
+        .with_completion_notify(self.completion.clone());
         scheduler_loop.process_active_executions().await
     }
 
@@ -96,6 +96,8 @@ pub struct SchedulerLoop<'a> {
     shutdown_rx: Option<tokio::sync::watch::Receiver<bool>>,
     /// Consecutive error count for circuit breaker / backoff.
     consecutive_errors: u32,
+    /// Notified after a workflow execution is marked Completed or Failed.
+    completion: Option<Arc<tokio::sync::Notify>>,
 }
 
 impl<'a> SchedulerLoop<'a> {
@@ -115,6 +117,7 @@ impl<'a> SchedulerLoop<'a> {
             dispatcher,
             shutdown_rx: None,
             consecutive_errors: 0,
+            completion: None,
         }
     }
 
@@ -124,6 +127,12 @@ impl<'a> SchedulerLoop<'a> {
         self
     }
 
+    /// Set the signal notified when a workflow execution reaches a terminal state.
+    pub fn with_completion_notify(mut self, completion: Arc<tokio::sync::Notify>) -> Self {
+        self.completion = Some(completion);
+        self
+    }
+
     /// Runs the main scheduling loop that continuously processes active workflow executions.
     ///
     /// This loop:
@@ -469,6 +478,12 @@ impl<'a> SchedulerLoop<'a> {
             );
         }
 
+        // Wake anyone blocked in `execute` on this (or any) execution; they
+        // re-read their own execution's status.
+        if let Some(completion) = &self.completion {
+            completion.notify_waiters();
+        }
+
         // Record workflow execution duration. The active-workflows gauge is
         // SQL-derived in process_active_executions and does NOT need an
         // explicit decrement here — the next tick will re-seed it from the
@@ -58,6 +58,10 @@ impl<'a> StateManager<'a> {
         statuses: &HashMap<String, String>,
     ) -> Result<(), ValidationError> {
         let workflow_execution_id = workflow_execution.id;
+        // Ready transitions are collected and written in one transaction
+        // after the loop; readiness is decided from `statuses`, so deferring
+        // the writes does not change which tasks become ready.
+        let mut ready_task_ids = Vec::new();
         for task_execution in pending_tasks {
             // CLOACI-T-0745: dependency gating resolves from the pre-loaded
             // per-execution status map — no per-task DB round-trips.
@@ -72,10 +76,7 @@ impl<'a> StateManager<'a> {
 
                 if trigger_rules_satisfied {
                     // Mark ready in database - dispatch is handled separately by scheduler_loop
-                    self.dal
-                        .task_execution()
-                        .mark_ready(task_execution.id)
-                        .await?;
+                    ready_task_ids.push(task_execution.id);
                     info!("Task ready: {} (workflow execution: {}, dependencies satisfied, trigger rules passed)",
                           task_execution.task_name, workflow_execution_id);
                 } else {
@@ -90,6 +91,11 @@ impl<'a> StateManager<'a> {
             }
         }
 
+        self.dal
+            .task_execution()
+            .mark_ready_batch(ready_task_ids)
+            .await?;
+
         Ok(())
     }
 
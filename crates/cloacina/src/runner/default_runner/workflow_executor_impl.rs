@@ -70,11 +70,20 @@ impl WorkflowExecutor for DefaultRunner {
             message: format!("Failed to schedule workflow: {}", e),
         })?;
 
-        // Wait for completion
+        // Wait for completion. The scheduler signals `completion` when it
+        // finishes an execution; the 500ms sleep remains as a fallback for
+        // executions completed by another scheduler instance.
         let start_time = std::time::Instant::now();
         let dal = DAL::new(self.database.clone());
+        let completion = self.scheduler.completion_notify().clone();
 
         loop {
+            // Register for the signal before reading status so a completion
+            // landing between the read and the wait is not missed.
+            let notified = completion.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+
             // Check timeout
             if let Some(timeout) = self.config.workflow_timeout() {
                 if start_time.elapsed() > timeout {
@@ -101,7 +110,10 @@ impl WorkflowExecutor for DefaultRunner {
                     return self.build_workflow_result(execution_id).await;
                 }
                 _ => {
-                    tokio::time::sleep(Duration::from_millis(500)).await;
+                    tokio::select! {
+                        _ = &mut notified => {}
+                        _ = tokio::time::sleep(Duration::from_millis(500)) => {}
+                    }
                 }
             }
         }
@@ -165,8 +177,13 @@ impl WorkflowExecutor for DefaultRunner {
         // Poll for status changes and call callback
         let mut last_status = WorkflowStatus::Pending;
         callback.on_status_change(last_status.clone());
+        let completion = self.scheduler.completion_notify().clone();
 
         loop {
+            let notified = completion.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+
             let current_status = self.get_execution_status(execution_id).await?;
 
             if current_status != last_status {
@@ -178,7 +195,10 @@ impl WorkflowExecutor for DefaultRunner {
                 return self.get_execution_result(execution_id).await;
             }
 
-            tokio::time::sleep(Duration::from_millis(500)).await;
+            tokio::select! {
+                _ = &mut notified => {}
+                _ = tokio::time::sleep(Duration::from_millis(500)) => {}
+            }
         }
     }
 
@@ -22,6 +22,7 @@
 use petgraph::algo::{is_cyclic_directed, toposort};
 use petgraph::{Directed, Graph};
 use std::collections::{HashMap, HashSet};
+use std::sync::OnceLock;
 
 use crate::error::ValidationError;
 use crate::task::TaskNamespace;
@@ -43,6 +44,8 @@ use crate::task::TaskNamespace;
 /// - Edges represent dependencies (from dependent to dependency)
 /// - Cycles are detected using depth-first search
 /// - Topological sorting uses Kahn's algorithm
+/// - The topological order is computed once and memoized until the graph is
+///   mutated, so repeated scheduling of a static workflow does not re-sort it
 ///
 /// # Examples
 ///
@@ -61,6 +64,9 @@ use crate::task::TaskNamespace;
 pub struct DependencyGraph {
     nodes: HashSet<TaskNamespace>,
     edges: HashMap<TaskNamespace, Vec<TaskNamespace>>,
+    /// Memoized result of a successful `topological_sort`; cleared by every
+    /// mutation.
+    sorted: OnceLock<Vec<TaskNamespace>>,
 }
 
 impl DependencyGraph {
@@ -69,17 +75,20 @@ impl DependencyGraph {
         Self {
             nodes: HashSet::new(),
             edges: HashMap::new(),
+            sorted: OnceLock::new(),
         }
     }
 
     /// Add a node (task) to the graph
     pub fn add_node(&mut self, node_id: TaskNamespace) {
+        self.sorted.take();
         self.nodes.insert(node_id.clone());
         self.edges.entry(node_id).or_default();
     }
 
     /// Add an edge (dependency) to the graph
     pub fn add_edge(&mut self, from: TaskNamespace, to: TaskNamespace) {
+        self.sorted.take();
         self.nodes.insert(from.clone());
         self.nodes.insert(to.clone());
         self.edges.entry(from).or_default().push(to);
@@ -88,6 +97,7 @@ impl DependencyGraph {
     /// Remove a node (task) from the graph
     /// This also removes all edges involving this node
     pub fn remove_node(&mut self, node_id: &TaskNamespace) {
+        self.sorted.take();
         self.nodes.remove(node_id);
         self.edges.remove(node_id);
 
@@ -99,6 +109,7 @@ impl DependencyGraph {
 
     /// Remove a specific edge (dependency) from the graph
     pub fn remove_edge(&mut self, from: &TaskNamespace, to: &TaskNamespace) {
+        self.sorted.take();
         if let Some(deps) = self.edges.get_mut(from) {
             deps.retain(|dep| dep != to);
         }
@@ -125,6 +136,11 @@ impl DependencyGraph {
 
     /// Check if the graph contains cycles
     pub fn has_cycles(&self) -> bool {
+        // A memoized topological order proves the graph is acyclic
+        if self.sorted.get().is_some() {
+            return false;
+        }
+
         let mut graph = Graph::<TaskNamespace, (), Directed>::new();
         let mut node_indices = HashMap::new();
 
@@ -150,6 +166,10 @@ impl DependencyGraph {
 
     /// Get tasks in topological order
     pub fn topological_sort(&self) -> Result<Vec<TaskNamespace>, ValidationError> {
+        if let Some(sorted) = self.sorted.get() {
+            return Ok(sorted.clone());
+        }
+
         if self.has_cycles() {
             return Err(ValidationError::CyclicDependency {
                 cycle: self
@@ -183,7 +203,9 @@ impl DependencyGraph {
 
         match toposort(&graph, None) {
             Ok(sorted) => {
-                let result = sorted.into_iter().map(|idx| graph[idx].clone()).collect();
+                let result: Vec<TaskNamespace> =
+                    sorted.into_iter().map(|idx| graph[idx].clone()).collect();
+                let _ = self.sorted.set(result.clone());
                 Ok(result)
             }
             Err(_) => Err(ValidationError::CyclicDependency {
@@ -495,6 +517,23 @@ mod tests {
         ));
     }
 
+    #[test]
+    fn test_topological_sort_memo_invalidated_by_mutation() {
+        let mut graph = DependencyGraph::new();
+        let a = ns("a");
+        let b = ns("b");
+        graph.add_edge(b.clone(), a.clone());
+        assert_eq!(graph.topological_sort().unwrap().len(), 2);
+
+        // Closing a cycle after a successful sort must not reuse the memo
+        graph.add_edge(a.clone(), b.clone());
+        assert!(graph.has_cycles());
+        assert!(graph.topological_sort().is_err());
+
+        graph.remove_edge(&a, &b);
+        assert_eq!(graph.topological_sort().unwrap(), vec![a, b]);
+    }
+
     #[test]
     fn test_default_creates_empty_graph() {
         let graph = DependencyGraph::default();
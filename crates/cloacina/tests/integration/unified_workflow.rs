@@ -78,6 +78,43 @@ async fn test_workflow_executes_sqlite() {
     runner.shutdown().await.expect("Shutdown failed");
 }
 
+/// `execute` wakes on the scheduler's completion signal rather than its 500ms
+/// status-poll fallback, so a short workflow returns well inside one poll.
+#[cfg(feature = "sqlite")]
+#[tokio::test]
+async fn test_execute_returns_on_completion_signal() {
+    let config = DefaultRunnerConfig::builder()
+        .enable_registry_reconciler(false)
+        .scheduler_poll_interval(std::time::Duration::from_millis(20))
+        .build()
+        .unwrap();
+
+    let runner = DefaultRunner::with_config(":memory:", config)
+        .await
+        .expect("Failed to create runner");
+
+    // Warm up so one-time startup cost is not measured.
+    runner
+        .execute("unified_test_workflow", Context::new())
+        .await
+        .expect("Workflow execution failed");
+
+    let started = std::time::Instant::now();
+    runner
+        .execute("unified_test_workflow", Context::new())
+        .await
+        .expect("Workflow execution failed");
+    let elapsed = started.elapsed();
+
+    assert!(
+        elapsed < std::time::Duration::from_millis(400),
+        "execute took {:?}; expected the completion signal to beat the 500ms poll",
+        elapsed
+    );
+
+    runner.shutdown().await.expect("Shutdown failed");
+}
+
 // --- Trigger macro tests ---
 
 use cloacina_workflow::TriggerResult;
@@ -80,6 +80,10 @@ pub fn pack_to(dir: &Path, out: Option<&Path>) -> Result<PathBuf, CliError> {
                 .unwrap_or_else(|| "package".to_string()),
         );
         copy_package_tree(dir, &stage_dir)?;
+        // The staged package.toml may be a hard link to the source manifest;
+        // unlink it first so writing the resolved form can't touch the source.
+        std::fs::remove_file(stage_dir.join("package.toml"))
+            .map_err(|e| CliError::UserError(format!("unlink staged manifest: {e}")))?;
         std::fs::write(
             stage_dir.join("package.toml"),
             toml::to_string_pretty(&resolved)
@@ -98,6 +102,11 @@ pub fn pack_to(dir: &Path, out: Option<&Path>) -> Result<PathBuf, CliError> {
 /// Recursive copy of a package source tree into `dst`, skipping build
 /// output/VCS dirs that don't belong in an archive (`target`, `.git`,
 /// `node_modules`, `__pycache__`) and any prior archives.
+///
+/// Files are hard-linked where possible — the stage is only read by
+/// `pack_package`, so sharing inodes avoids rewriting every byte of large
+/// trees (vendored wheels, etc.). Falls back to a copy when linking fails
+/// (e.g. the temp dir is on another filesystem).
 fn copy_package_tree(src: &Path, dst: &Path) -> Result<(), CliError> {
     std::fs::create_dir_all(dst).map_err(|e| CliError::UserError(format!("staging copy: {e}")))?;
     for entry in
@@ -117,7 +126,7 @@ fn copy_package_tree(src: &Path, dst: &Path) -> Result<(), CliError> {
         let to = dst.join(&name);
         if from.is_dir() {
             copy_package_tree(&from, &to)?;
-        } else {
+        } else if std::fs::hard_link(&from, &to).is_err() {
             std::fs::copy(&from, &to)
                 .map_err(|e| CliError::UserError(format!("staging copy {name_str}: {e}")))?;
         }
@@ -47,10 +47,11 @@ def aggregate_data(context):
         return context
 
     values = [r["value"] for r in records]
+    total = sum(values)
     context.set("aggregations", {
         "count": len(values),
-        "sum": sum(values),
-        "avg": sum(values) / len(values),
+        "sum": total,
+        "avg": total / len(values),
         "min": min(values),
         "max": max(values),
     })
@@ -32,10 +32,12 @@ with cloaca.WorkflowBuilder("simple_workflow") as builder:
         """Initialize the workflow with some data."""
         print("Starting the workflow...")
 
-        # Add initial data to the context
-        context.set("process_id", "proc_001")
-        context.set("start_time", "2025-01-07T10:00:00Z")
-        context.set("items_to_process", 10)
+        # Add initial data to the context in one call
+        context.update_from_dict({
+            "process_id": "proc_001",
+            "start_time": "2025-01-07T10:00:00Z",
+            "items_to_process": 10
+        })
 
         print(f"Process {context.get('process_id')} initialized")
         return context
@@ -121,8 +123,8 @@ if __name__ == "__main__":
 
     else:
         print(f"Workflow failed with status: {result.status}")
-        if hasattr(result, 'error'):
-            print(f"Error: {result.error}")
+        if result.error_message:
+            print(f"Error: {result.error_message}")
 
         # Clean up before exiting
         print("\nCleaning up...")
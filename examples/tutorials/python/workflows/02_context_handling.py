@@ -22,8 +22,21 @@ Prerequisites:
 
 import sys
 import cloaca
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime
 
+# Grade cutoffs in ascending order; bisect maps a score to its letter
+# without walking an if/elif chain.
+GRADE_THRESHOLDS = [70, 80, 90]
+GRADE_LETTERS = "FCBA"
+
+
+def grade_for_score(score):
+    """Return the letter grade for a numeric score."""
+    return GRADE_LETTERS[bisect_right(GRADE_THRESHOLDS, score)]
+
+
 # Data transformation pipeline
 # Build the complete data transformation pipeline using workflow-scoped pattern
 with cloaca.WorkflowBuilder("data_pipeline") as builder:
@@ -65,32 +78,21 @@ with cloaca.WorkflowBuilder("data_pipeline") as builder:
             raise ValueError("No raw data found in context")
 
         # Transform data
-        transformed_users = []
-        total_score = 0
-
-        for user in raw_data["users"]:
-            # Calculate grade based on score
-            score = user["score"]
-            if score >= 90:
-                grade = "A"
-            elif score >= 80:
-                grade = "B"
-            elif score >= 70:
-                grade = "C"
-            else:
-                grade = "F"
-
-            transformed_user = {
+        transformed_users = [
+            {
                 "user_id": user["id"],
                 "display_name": user["name"].upper(),
                 "email_domain": user["email"].split("@")[1],
-                "score": score,
-                "grade": grade,
-                "performance": "high" if score >= 85 else "standard"
+                "score": user["score"],
+                "grade": grade_for_score(user["score"]),
+                "performance": "high" if user["score"] >= 85 else "standard"
             }
+            for user in raw_data["users"]
+        ]
 
-            transformed_users.append(transformed_user)
-            total_score += score
+        # Tally every grade in one pass instead of one scan per letter
+        grade_counts = Counter(u["grade"] for u in transformed_users)
+        total_score = sum(u["score"] for u in transformed_users)
 
         # Create summary statistics
         transformation_result = {
@@ -98,19 +100,17 @@ with cloaca.WorkflowBuilder("data_pipeline") as builder:
             "summary": {
                 "total_users": len(transformed_users),
                 "average_score": total_score / len(transformed_users),
-                "high_performers": len([u for u in transformed_users if u["performance"] == "high"]),
-                "grade_distribution": {
-                    "A": len([u for u in transformed_users if u["grade"] == "A"]),
-                    "B": len([u for u in transformed_users if u["grade"] == "B"]),
-                    "C": len([u for u in transformed_users if u["grade"] == "C"]),
-                    "F": len([u for u in transformed_users if u["grade"] == "F"])
-                }
+                "high_performers": sum(1 for u in transformed_users if u["performance"] == "high"),
+                "grade_distribution": {grade: grade_counts[grade] for grade in "ABCF"}
             },
             "transformed_at": datetime.now().isoformat()
         }
 
-        context.set("transformed_data", transformation_result)
-        context.set("transformation_complete", True)
+        # Several related keys can be written in a single call
+        context.update_from_dict({
+            "transformed_data": transformation_result,
+            "transformation_complete": True
+        })
 
         print(f"Transformed {len(transformed_users)} users")
         print(f"Average score: {transformation_result['summary']['average_score']:.1f}")
@@ -137,30 +137,25 @@ with cloaca.WorkflowBuilder("data_pipeline") as builder:
         # Validation checks
         users = transformed_data["users"]
 
-        # Check 1: All users have required fields
+        # Checks 1-3 run in a single pass over the users:
+        # required fields, valid score range, and grade consistency
         required_fields = ["user_id", "display_name", "email_domain", "score", "grade"]
+        errors = validation_results["errors"]
         for user in users:
             for field in required_fields:
                 if field not in user:
-                    validation_results["errors"].append(
+                    errors.append(
                         f"User {user.get('user_id', 'unknown')} missing field: {field}"
                     )
 
-        # Check 2: Score ranges are valid
-        for user in users:
             score = user.get("score", 0)
             if not (0 <= score <= 100):
-                validation_results["errors"].append(
-                    f"User {user['user_id']} has invalid score: {score}"
-                )
+                errors.append(f"User {user['user_id']} has invalid score: {score}")
 
-        # Check 3: Grade consistency
-        for user in users:
-            score = user.get("score", 0)
             grade = user.get("grade", "")
-            expected_grade = "A" if score >= 90 else "B" if score >= 80 else "C" if score >= 70 else "F"
+            expected_grade = grade_for_score(score)
             if grade != expected_grade:
-                validation_results["errors"].append(
+                errors.append(
                     f"User {user['user_id']} grade mismatch: expected {expected_grade}, got {grade}"
                 )
 
@@ -179,9 +174,11 @@ with cloaca.WorkflowBuilder("data_pipeline") as builder:
         validation_status = "passed" if not validation_results["errors"] else "failed"
         validation_results["status"] = validation_status
 
-        context.set("validation_results", validation_results)
-        context.set("validation_complete", True)
-        context.set("data_valid", validation_status == "passed")
+        context.update_from_dict({
+            "validation_results": validation_results,
+            "validation_complete": True,
+            "data_valid": validation_status == "passed"
+        })
 
         print(f"Validation {validation_status}")
         if validation_results["errors"]:
@@ -289,8 +286,8 @@ if __name__ == "__main__":
 
     else:
         print(f"Pipeline failed with status: {result.status}")
-        if hasattr(result, 'error'):
-            print(f"Error: {result.error}")
+        if result.error_message:
+            print(f"Error: {result.error_message}")
 
         # Clean up before exiting
         print("\nCleaning up...")
@@ -578,8 +578,8 @@ if __name__ == "__main__":
 
     else:
         print(f"Workflow failed with status: {result.status}")
-        if hasattr(result, 'error'):
-            print(f"Error: {result.error}")
+        if result.error_message:
+            print(f"Error: {result.error_message}")
 
         # Clean up before exiting
         print("\nCleaning up...")
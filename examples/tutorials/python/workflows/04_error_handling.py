@@ -24,7 +24,9 @@ Prerequisites:
 import sys
 import cloaca
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Simulate external service that can fail
@@ -34,10 +36,14 @@ class UnreliableExternalService:
     def __init__(self, failure_rate=0.3):
         self.failure_rate = failure_rate
         self.call_count = 0
+        self._lock = threading.Lock()
 
     def fetch_data(self, data_id):
         """Fetch data with potential for failure."""
-        self.call_count += 1
+        # Calls may arrive from several threads at once
+        with self._lock:
+            self.call_count += 1
+            call_number = self.call_count
 
         if random.random() < self.failure_rate:
             if random.random() < 0.5:
@@ -52,12 +58,74 @@ class UnreliableExternalService:
             "id": data_id,
             "data": f"important_data_{data_id}",
             "timestamp": datetime.now().isoformat(),
-            "fetch_attempt": self.call_count
+            "fetch_attempt": call_number
         }
 
 # Create service instance
 external_service = UnreliableExternalService(failure_rate=0.4)
 
+
+def fetch_one(data_id):
+    """Fetch a single item, returning (result, error_info) with one of them None."""
+    try:
+        return external_service.fetch_data(data_id), None
+    except ConnectionError as e:
+        # Network-related errors (might be transient)
+        error_type, retryable, message = "connection_error", True, str(e)
+    except ValueError as e:
+        # Validation errors (not retryable)
+        error_type, retryable, message = "validation_error", False, str(e)
+    except Exception as e:
+        # Unexpected errors
+        error_type, retryable, message = "unexpected_error", False, str(e)
+
+    return None, {
+        "data_id": data_id,
+        "error_type": error_type,
+        "error_message": message,
+        "timestamp": datetime.now().isoformat(),
+        "retryable": retryable
+    }
+
+
+def retry_fetch(error_info, max_retries=3):
+    """Retry one failed fetch with exponential backoff.
+
+    Returns (success, failure) with exactly one of them None.
+    """
+    data_id = error_info["data_id"]
+
+    for attempt in range(max_retries):
+        try:
+            # Exponential backoff: wait 2^attempt seconds
+            if attempt > 0:
+                wait_time = 2 ** attempt
+                print(f"  Waiting {wait_time}s before retry {attempt + 1} for {data_id}")
+                time.sleep(wait_time)
+
+            print(f"  Retry attempt {attempt + 1}/{max_retries} for {data_id}")
+            result = external_service.fetch_data(data_id)
+
+            print(f"  ✓ Retry successful for {data_id} on attempt {attempt + 1}")
+            return {
+                "data_id": data_id,
+                "result": result,
+                "retry_attempt": attempt + 1,
+                "original_error": error_info["error_message"]
+            }, None
+
+        except Exception as e:
+            print(f"  ✗ Retry {attempt + 1} failed for {data_id}: {e}")
+            last_error = str(e)
+
+    return None, {
+        "data_id": data_id,
+        "final_error": last_error,
+        "retry_attempts": max_retries,
+        "original_error": error_info["error_message"]
+    }
+
+
 # Build the error handling and recovery workflow using workflow-scoped pattern
 with cloaca.WorkflowBuilder("error_handling_workflow") as builder:
     builder.description("Demonstrates comprehensive error handling, retry logic, and recovery patterns")
@@ -73,48 +141,23 @@ with cloaca.WorkflowBuilder("error_handling_workflow") as builder:
         fetched_data = []
         errors = []
 
-        for data_id in data_ids:
-            try:
-                # Attempt to fetch data
-                result = external_service.fetch_data(data_id)
+        # The fetches are I/O-bound, so run them concurrently: total wait is
+        # roughly one fetch instead of one per ID. map() keeps input order.
+        with ThreadPoolExecutor(max_workers=max(len(data_ids), 1)) as pool:
+            outcomes = list(pool.map(fetch_one, data_ids))
+
+        labels = {
+            "connection_error": "Connection error",
+            "validation_error": "Validation error",
+            "unexpected_error": "Unexpected error"
+        }
+        for data_id, (result, error_info) in zip(data_ids, outcomes):
+            if error_info is None:
                 fetched_data.append(result)
                 print(f"✓ Successfully fetched {data_id}")
-
-            except ConnectionError as e:
-                # Network-related errors (might be transient)
-                error_info = {
-                    "data_id": data_id,
-                    "error_type": "connection_error",
-                    "error_message": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                    "retryable": True
-                }
-                errors.append(error_info)
-                print(f"✗ Connection error for {data_id}: {e}")
-
-            except ValueError as e:
-                # Validation errors (not retryable)
-                error_info = {
-                    "data_id": data_id,
-                    "error_type": "validation_error",
-                    "error_message": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                    "retryable": False
-                }
-                errors.append(error_info)
-                print(f"✗ Validation error for {data_id}: {e}")
-
-            except Exception as e:
-                # Unexpected errors
-                error_info = {
-                    "data_id": data_id,
-                    "error_type": "unexpected_error",
-                    "error_message": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                    "retryable": False
-                }
+            else:
                 errors.append(error_info)
-                print(f"✗ Unexpected error for {data_id}: {e}")
+                print(f"✗ {labels[error_info['error_type']]} for {data_id}: {error_info['error_message']}")
 
         # Store results and errors in context
         context.set("fetched_data", fetched_data)
@@ -153,39 +196,16 @@ with cloaca.WorkflowBuilder("error_handling_workflow") as builder:
         retry_successful = []
         still_failed = []
 
-        for error_info in retryable_errors:
-            data_id = error_info["data_id"]
-            max_retries = 3
-
-            for attempt in range(max_retries):
-                try:
-                    # Exponential backoff: wait 2^attempt seconds
-                    if attempt > 0:
-                        wait_time = 2 ** attempt
-                        print(f"  Waiting {wait_time}s before retry {attempt + 1} for {data_id}")
-                        time.sleep(wait_time)
-
-                    print(f"  Retry attempt {attempt + 1}/{max_retries} for {data_id}")
-                    result = external_service.fetch_data(data_id)
-
-                    retry_successful.append({
-                        "data_id": data_id,
-                        "result": result,
-                        "retry_attempt": attempt + 1,
-                        "original_error": error_info["error_message"]
-                    })
-                    print(f"  ✓ Retry successful for {data_id} on attempt {attempt + 1}")
-                    break
-
-                except Exception as e:
-                    print(f"  ✗ Retry {attempt + 1} failed for {data_id}: {e}")
-                    if attempt == max_retries - 1:  # Last attempt
-                        still_failed.append({
-                            "data_id": data_id,
-                            "final_error": str(e),
-                            "retry_attempts": max_retries,
-                            "original_error": error_info["error_message"]
-                        })
+        # Each ID backs off on its own thread, so the waits for different IDs
+        # overlap instead of adding up. map() keeps input order.
+        with ThreadPoolExecutor(max_workers=len(retryable_errors)) as pool:
+            outcomes = list(pool.map(retry_fetch, retryable_errors))
+
+        for success, failure in outcomes:
+            if success is not None:
+                retry_successful.append(success)
+            else:
+                still_failed.append(failure)
 
         # Merge successful retries with original fetched data
         original_fetched = context.get("fetched_data", [])
@@ -445,8 +465,8 @@ if __name__ == "__main__":
 
     else:
         print(f"Workflow failed with status: {result.status}")
-        if hasattr(result, 'error'):
-            print(f"Error: {result.error}")
+        if result.error_message:
+            print(f"Error: {result.error_message}")
 
         # Clean up before exiting
         print("\nCleaning up...")